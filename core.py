@@ -9,6 +9,7 @@ Zentrale Logik für MediaBrain:
 """
 
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Union, Tuple, List
@@ -31,12 +32,33 @@ except ImportError:
 # ============================================================
 
 class Database:
+    # Verbindungs-Tuning für die lese-lastige Suche (WAL, mmap, 64 MB Page-Cache)
+    _PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+    )
+
     def __init__(self, db_path="media_brain.db"):
-        self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(self.db_path)
+        # ":memory:" bleibt ein String (In-Memory-DB, z.B. für Tests)
+        self.db_path = db_path if db_path == ":memory:" else Path(db_path)
+        # Größerer Statement-Cache: SearchEngine erzeugt viele, aber feste Query-Formen
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
+        self._configure()
+        self._write_listeners = []
         self._setup()
 
+    def _configure(self):
+        """Setzt die Verbindungs-PRAGMAs; nicht unterstützte (z.B. WAL auf read-only Mounts) werden übersprungen."""
+        for pragma in self._PRAGMAS:
+            try:
+                self.conn.execute(pragma)
+            except sqlite3.OperationalError as e:
+                print(f"[DB] {pragma} nicht gesetzt: {e}")
+
     def _setup(self):
         """Initialisiert die Datenbank und Tabellen."""
         self.conn.execute("""
@@ -75,13 +97,70 @@ class Database:
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_favorite ON media_items(is_favorite);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_blacklist ON media_items(blacklist_flag);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_title ON media_items(title);")
+        # Präfix-Suche (Autocomplete) als Bereichsabfrage ohne Groß-/Kleinschreibung
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_title_nocase ON media_items(title COLLATE NOCASE);")
 
         # Composite Indizes für häufige Kombinationen
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_type_blacklist ON media_items(type, blacklist_flag);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_favorite_blacklist ON media_items(is_favorite, blacklist_flag);")
+        # Filter + Sortierung der SearchEngine (WHERE/ORDER BY/LIMIT ohne Sortierschritt)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_bl_type_opened ON media_items(blacklist_flag, type, last_opened_at DESC);")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_bl_fav_opened ON media_items(blacklist_flag, is_favorite, last_opened_at DESC);")
+
+        # Volltextsuche über Titel + Beschreibung (falls SQLite mit FTS5 gebaut ist)
+        self.has_fts = self._setup_fts()
 
         self.conn.commit()
 
+    def _setup_fts(self) -> bool:
+        """
+        Legt den FTS5-Index media_items_fts (External Content) samt Sync-Triggern an.
+
+        Beim ersten Anlegen wird der Index aus den vorhandenen Einträgen aufgebaut.
+
+        Returns:
+            True wenn FTS5 verfügbar ist, sonst False (Suche fällt auf LIKE zurück)
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='media_items_fts'"
+        ).fetchone()
+        try:
+            self.conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS media_items_fts USING fts5(
+                title, description,
+                content='media_items', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS media_items_fts_ai AFTER INSERT ON media_items BEGIN
+            INSERT INTO media_items_fts(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+        """)
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS media_items_fts_ad AFTER DELETE ON media_items BEGIN
+            INSERT INTO media_items_fts(media_items_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END;
+        """)
+        # Nur bei Änderungen an Titel/Beschreibung (nicht bei last_opened_at usw.)
+        self.conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS media_items_fts_au AFTER UPDATE OF title, description ON media_items BEGIN
+            INSERT INTO media_items_fts(media_items_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO media_items_fts(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END;
+        """)
+
+        if not exists:
+            self.conn.execute("INSERT INTO media_items_fts(media_items_fts) VALUES ('rebuild')")
+        return True
+
     def execute(self, query: str, params: Tuple = ()) -> sqlite3.Cursor:
         """
         Führt eine SQL-Query aus und committed die Änderungen.
@@ -95,8 +174,44 @@ class Database:
         """
         cur = self.conn.execute(query, params)
         self.conn.commit()
+        if query.lstrip()[:6].upper() != "SELECT":
+            self._notify_write()
         return cur
 
+    def add_write_listener(self, callback):
+        """
+        Registriert einen Callback, der nach jedem Schreibzugriff aufgerufen wird.
+
+        Gedacht für Caches über der Datenbank (z.B. SearchEngine), die bei
+        Änderungen verworfen werden müssen.
+        """
+        self._write_listeners.append(callback)
+
+    def _notify_write(self):
+        for callback in self._write_listeners:
+            callback()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Fasst mehrere Schreibzugriffe in einer expliziten Transaktion zusammen.
+
+        Ein einziges COMMIT am Ende statt eines Commits pro Statement
+        (im WAL-Modus nur ein fsync für den ganzen Batch).
+        Bei einer Exception wird zurückgerollt.
+
+        Yields:
+            sqlite3.Connection für execute()/executemany() innerhalb der Transaktion
+        """
+        self.conn.execute("BEGIN")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        self._notify_write()
+
     def fetchall(self, query: str, params: Tuple = ()) -> List[sqlite3.Row]:
         """
         Führt eine SELECT-Query aus und gibt alle Ergebnisse zurück.
@@ -146,6 +261,15 @@ class MediaItem:
         blacklist_flag: Blacklist-Status (0 = nicht gesperrt, 1 = gesperrt)
         procedure_code: Blacklist-Dauer Code (0-6)
     """
+    # Feste Attribute ohne __dict__ pro Instanz (Suchen erzeugen bis zu 500 Items)
+    __slots__ = (
+        "id", "title", "type", "source", "provider_id", "length_seconds",
+        "created_at", "last_opened_at", "open_method", "is_favorite",
+        "is_local_file", "local_path", "description", "thumbnail_url",
+        "season", "episode", "artist", "album", "channel",
+        "blacklist_flag", "blacklisted_at", "procedure_code",
+    )
+
     def __init__(self, row):
         self.id = row["id"]
         self.title = row["title"]
@@ -255,6 +379,9 @@ class BlacklistManager:
 # ============================================================
 
 class MediaManager:
+    # Erlaubte Werte für media_items.type
+    ALLOWED_TYPES = ["movie", "series", "music", "clip", "podcast", "audiobook", "document", "file"]
+
     def __init__(self, db: Database):
         self.db = db
 
@@ -275,13 +402,9 @@ class MediaManager:
         """, (provider_id, source))
         return MediaItem(row) if row else None
 
-    def add_or_update(self, data: dict, origin="external"):
+    def _validate(self, data: dict):
         """
-        Fügt ein neues Medium hinzu oder aktualisiert ein bestehendes.
-
-        Args:
-            data: Dict mit Medien-Daten (muss mindestens 'type', 'source', 'provider_id' enthalten)
-            origin: "external" (von Providers) oder "internal" (manuelle Eingabe)
+        Prüft und normalisiert ein Medien-Dict (in-place).
 
         Raises:
             ValueError: Wenn required fields fehlen oder invalid sind
@@ -296,9 +419,8 @@ class MediaManager:
                 raise ValueError(f"Required field cannot be empty: {field}")
 
         # Type muss aus erlaubten Werten sein
-        allowed_types = ["movie", "series", "music", "clip", "podcast", "audiobook", "document", "file"]
-        if data["type"] not in allowed_types:
-            raise ValueError(f"Invalid type: {data['type']}. Allowed: {allowed_types}")
+        if data["type"] not in self.ALLOWED_TYPES:
+            raise ValueError(f"Invalid type: {data['type']}. Allowed: {self.ALLOWED_TYPES}")
 
         # Source darf keine SQL-kritischen Zeichen enthalten (zusätzliche Sicherheit)
         if any(c in str(data["source"]) for c in ["'", '"', ";", "--"]):
@@ -334,6 +456,19 @@ class MediaManager:
 
         # === END VALIDATION ===
 
+    def add_or_update(self, data: dict, origin="external"):
+        """
+        Fügt ein neues Medium hinzu oder aktualisiert ein bestehendes.
+
+        Args:
+            data: Dict mit Medien-Daten (muss mindestens 'type', 'source', 'provider_id' enthalten)
+            origin: "external" (von Providers) oder "internal" (manuelle Eingabe)
+
+        Raises:
+            ValueError: Wenn required fields fehlen oder invalid sind
+        """
+        self._validate(data)
+
         existing = self.get_by_provider(data["provider_id"], data["source"])
 
         if existing and existing.blacklist_flag == 1 and origin == "external":
@@ -406,6 +541,82 @@ class MediaManager:
             # print(f"[DB] Erfolgreich gespeichert: {data['title']}") # Debug Print
         except Exception as e:
             print(f"[DB] INSERT ERROR: {e}")
+
+    def add_or_update_many(self, items, origin="external"):
+        """
+        Fügt mehrere Medien in einer Transaktion hinzu bzw. aktualisiert sie.
+
+        Der ganze Batch wird vor dem Schreiben validiert, ein ungültiger
+        Eintrag bricht also ab, ohne dass etwas geschrieben wurde. Geschrieben
+        wird per executemany-Upsert mit derselben Semantik wie add_or_update,
+        Metadaten werden dabei aber nicht nachgeladen.
+
+        Args:
+            items: Iterable von Medien-Dicts (wie bei add_or_update)
+            origin: "external" (von Providers) oder "internal" (manuelle Eingabe)
+
+        Raises:
+            ValueError: Wenn ein Eintrag required fields vermissen lässt oder invalid ist
+        """
+        items = list(items)
+        for data in items:
+            self._validate(data)
+
+        now = datetime.now().isoformat()
+        rows = [(
+            data.get("title", "Unbekannt"),
+            data["type"],
+            data["source"],
+            data["provider_id"],
+            data.get("length_seconds"),
+            now,
+            data.get("open_method", "auto"),
+            1 if data.get("is_local_file") else 0,
+            data.get("local_path"),
+            data.get("description"),
+            data.get("thumbnail_url"),
+            data.get("season"),
+            data.get("episode"),
+            data.get("artist"),
+            data.get("album"),
+            data.get("channel"),
+            data.get("open_method"),
+            origin,
+        ) for data in items]
+
+        # Bestehende Einträge: nur last_opened_at/open_method aktualisieren,
+        # geblacklistete bei externem Ursprung unverändert lassen
+        with self.db.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO media_items (
+                    title, type, source, provider_id,
+                    length_seconds, last_opened_at,
+                    open_method, is_local_file, local_path,
+                    description, thumbnail_url, season, episode,
+                    artist, album, channel
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(provider_id, source) DO UPDATE
+                SET last_opened_at = excluded.last_opened_at,
+                    open_method = COALESCE(?, open_method)
+                WHERE blacklist_flag = 0 OR ? != 'external'
+            """, rows)
+
+    def update_metadata_many(self, rows):
+        """
+        Schreibt Online-Metadaten für mehrere Einträge in einer Transaktion.
+
+        Args:
+            rows: Iterable von (description, thumbnail_url, id); None-Werte
+                  behalten den bestehenden Wert (COALESCE)
+        """
+        with self.db.transaction() as conn:
+            conn.executemany("""
+                UPDATE media_items
+                SET description = COALESCE(?, description),
+                    thumbnail_url = COALESCE(?, thumbnail_url)
+                WHERE id = ?
+            """, rows)
+
     def list_by_type(self, media_type):
         """
         Gibt eine Liste von MediaItems für einen bestimmten Typ (movie, music, etc.) zurück.
@@ -420,7 +631,7 @@ class MediaManager:
         """, (media_type,))
         
         # Wandelt die Datenbank-Zeilen in MediaItem-Objekte um
-        return [MediaItem(r) for r in rows]
+        return list(map(MediaItem, rows))
 # ============================================================
 # 5. EventProcessor
 # ============================================================
@@ -19,6 +19,7 @@ from PyQt6.QtGui import QAction, QIcon
 from core import MediaManager, MediaItem, BlacklistManager
 import config
 from pathlib import Path
+from threading import Lock
 
 # Erweiterte Suche
 from search_advanced import AdvancedSearchBar, SearchEngine, SearchCriteria
@@ -38,6 +39,30 @@ def notify_gui_refresh():
         mw.refresh_all_views()
 
 
+_FETCHER_SINGLETON = None
+_FETCHER_LOCK = Lock()
+
+def get_fetcher(reload=False):
+    """Gibt eine gemeinsame MetadataFetcher-Instanz zurück (wird beim ersten Aufruf erstellt).
+
+    Vermeidet, dass jedes Detail-Panel Cache-DB, API-Fetcher und API-Keys neu initialisiert.
+    Thread-sicher, da auch Worker aus dem Thread-Pool darauf zugreifen.
+
+    Args:
+        reload: Instanz neu erstellen, falls sich die API-Keys geändert haben,
+                damit neu eingetragene Keys aus settings.json ohne Neustart greifen
+    """
+    global _FETCHER_SINGLETON
+    with _FETCHER_LOCK:
+        if reload and _FETCHER_SINGLETON is not None and _FETCHER_SINGLETON.keys_changed():
+            _FETCHER_SINGLETON.close()
+            _FETCHER_SINGLETON = None
+        if _FETCHER_SINGLETON is None:
+            from metadata_v2 import MetadataFetcher
+            _FETCHER_SINGLETON = MetadataFetcher()
+        return _FETCHER_SINGLETON
+
+
 # ============================================================
 # 1. Suchleiste
 # ============================================================
@@ -292,14 +317,16 @@ class MediaItemWidget(QFrame):
 
     def fetch_online_metadata(self):
         """Holt Online-Metadaten von TMDb/OMDb/MusicBrainz und aktualisiert den DB-Eintrag."""
-        from metadata_v2 import MetadataFetcher
         from PyQt6.QtWidgets import QMessageBox
 
         try:
-            fetcher = MetadataFetcher()
+            fetcher = get_fetcher()
 
-            # Status prüfen
+            # Status prüfen; ohne TMDb/OMDb-Key neu laden, falls inzwischen einer eingetragen wurde
             status = fetcher.get_status()
+            if not (status["tmdb"] or status["omdb"]):
+                fetcher = get_fetcher(reload=True)
+                status = fetcher.get_status()
             if not any(status.values()):
                 QMessageBox.warning(self, "API nicht verfügbar",
                     "Keine API-Keys konfiguriert. Bitte in settings.json eintragen.")
@@ -310,7 +337,8 @@ class MediaItemWidget(QFrame):
                 title=self.item.title,
                 media_type=self.item.type,
                 year=getattr(self.item, 'year', None),
-                artist=getattr(self.item, 'artist', None)
+                artist=getattr(self.item, 'artist', None),
+                wait_for_cover=True
             )
 
             if not result:
@@ -403,6 +431,7 @@ class LibraryView(QWidget):
         self.media_type = media_type
         self.media_manager = media_manager
         self.blacklist_manager = blacklist_manager
+        self.search_engine = SearchEngine(self.media_manager.db)
         
         # Layout
         layout = QVBoxLayout()
@@ -437,10 +466,9 @@ class LibraryView(QWidget):
 
     def apply_search(self, criteria: SearchCriteria):
         # Suche ausführen via SearchEngine (erweitert)
-        engine = SearchEngine(self.media_manager.db)
         # Typ erzwingen (da wir in einer Library-View sind)
         criteria.media_type = self.media_type
-        results = engine.search(criteria)
+        results = self.search_engine.search(criteria)
         self.model.update_data(results)
 
     def open_item_by_click(self, index):
@@ -550,6 +578,7 @@ class GlobalSearchView(QWidget):
         super().__init__()
         self.media_manager = media_manager
         self.blacklist_manager = blacklist_manager
+        self.search_engine = SearchEngine(self.media_manager.db)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -577,8 +606,7 @@ class GlobalSearchView(QWidget):
             if not criteria.text.strip() and not criteria.provider and not criteria.media_type:
                 return
 
-            engine = SearchEngine(self.media_manager.db)
-            results = engine.search(criteria)
+            results = self.search_engine.search(criteria)
 
             for item in results:
                 widget = MediaItemWidget(item, self.media_manager, self.blacklist_manager)
@@ -12,8 +12,11 @@ import requests
 import re
 import os
 import json
+import logging
 import sqlite3
 import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -24,11 +27,23 @@ try:
 except ImportError:
     HAS_BS4 = False
 
+# Kind-Logger des App-Loggers (logger_system) - Formatierung erst, wenn ein Handler ausgibt
+log = logging.getLogger("MediaBrain.metadata")
+
+
+class MetadataRequestError(Exception):
+    """Eine API-Anfrage ist fehlgeschlagen (Netzwerk, Timeout, HTTP-Fehler).
+
+    Wird nur mit raise_errors=True geworfen und grenzt "kein Treffer"
+    von "Anfrage gescheitert" ab - nur Ersteres darf als Miss gecacht werden.
+    """
+
 # ============================================================
 # Konfiguration - API Keys werden aus Umgebung oder Config geladen
 # ============================================================
 
 CONFIG_PATH = Path(__file__).parent / "settings.json"
+_DEFAULT_DB_PATH = str((Path(__file__).parent / "metadata_cache.db").resolve())
 
 def get_api_key(service):
     """Holt API-Key aus settings.json oder Umgebungsvariable."""
@@ -89,7 +104,7 @@ def fetch_opengraph(url):
         return data
 
     except Exception as e:
-        print(f"[Metadata] OpenGraph Fehler bei {url}: {e}")
+        log.warning("[Metadata] OpenGraph Fehler bei %s: %s", url, e)
         return None
 
 # ============================================================
@@ -109,8 +124,8 @@ class TMDbFetcher:
         """Prüft ob API-Key vorhanden ist."""
         return bool(self.api_key)
     
-    def search_movie(self, title, year=None):
-        """Sucht nach einem Film."""
+    def search_movie(self, title, year=None, raise_errors=False):
+        """Sucht nach einem Film. Mit raise_errors=True wirft ein Fehlschlag MetadataRequestError."""
         if not self.is_available():
             return None
             
@@ -129,18 +144,21 @@ class TMDbFetcher:
                 timeout=5
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("results"):
-                    return data["results"][0]  # Bester Treffer
+            if response.status_code != 200:
+                raise MetadataRequestError(f"HTTP {response.status_code}")
+            data = response.json()
+            if data.get("results"):
+                return data["results"][0]  # Bester Treffer
                     
         except Exception as e:
-            print(f"[TMDb] Suche fehlgeschlagen: {e}")
+            log.warning("[TMDb] Suche fehlgeschlagen: %s", e)
+            if raise_errors:
+                raise MetadataRequestError(f"TMDb: {e}") from e
         
         return None
     
-    def search_tv(self, title, year=None):
-        """Sucht nach einer Serie."""
+    def search_tv(self, title, year=None, raise_errors=False):
+        """Sucht nach einer Serie. Mit raise_errors=True wirft ein Fehlschlag MetadataRequestError."""
         if not self.is_available():
             return None
             
@@ -159,13 +177,16 @@ class TMDbFetcher:
                 timeout=5
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("results"):
-                    return data["results"][0]
+            if response.status_code != 200:
+                raise MetadataRequestError(f"HTTP {response.status_code}")
+            data = response.json()
+            if data.get("results"):
+                return data["results"][0]
                     
         except Exception as e:
-            print(f"[TMDb] TV-Suche fehlgeschlagen: {e}")
+            log.warning("[TMDb] TV-Suche fehlgeschlagen: %s", e)
+            if raise_errors:
+                raise MetadataRequestError(f"TMDb: {e}") from e
         
         return None
     
@@ -185,7 +206,7 @@ class TMDbFetcher:
                 return response.json()
                 
         except Exception as e:
-            print(f"[TMDb] Details fehlgeschlagen: {e}")
+            log.warning("[TMDb] Details fehlgeschlagen: %s", e)
         
         return None
     
@@ -235,25 +256,36 @@ class OMDbFetcher:
     """Holt Metadaten von OMDb (IMDb-basiert)."""
     
     BASE_URL = "http://www.omdbapi.com/"
+
+    # MediaBrain-Feld -> OMDb-Feld (Text-Felder, "N/A" wird zu None)
+    _FIELDS = {
+        "title": "Title",
+        "description": "Plot",
+        "imdb_id": "imdbID",
+        "year": "Year",
+        "director": "Director",
+        "actors": "Actors",
+        "runtime": "Runtime",
+    }
     
     def __init__(self, api_key=None):
         self.api_key = api_key or get_api_key("omdb")
+        # Einmalig festhalten statt pro Request neu aufzubauen
+        self._available = bool(self.api_key)
+        self._base_params = {"apikey": self.api_key, "plot": "short"}
 
     def is_available(self):
         """Prüft ob API-Key vorhanden ist."""
-        return bool(self.api_key)
+        return self._available
     
-    def search(self, title, year=None, media_type=None):
-        """Sucht nach einem Film/Serie."""
-        if not self.is_available():
+    def search(self, title, year=None, media_type=None, raise_errors=False):
+        """Sucht nach einem Film/Serie. Mit raise_errors=True wirft ein Fehlschlag MetadataRequestError."""
+        if not self._available:
             return None
             
         try:
-            params = {
-                "apikey": self.api_key,
-                "t": title,
-                "plot": "short"
-            }
+            params = self._base_params.copy()
+            params["t"] = title
             if year:
                 params["y"] = year
             if media_type:
@@ -261,13 +293,20 @@ class OMDbFetcher:
                 
             response = requests.get(self.BASE_URL, params=params, timeout=5)
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("Response") == "True":
-                    return data
+            if response.status_code != 200:
+                raise MetadataRequestError(f"HTTP {response.status_code}")
+            data = response.json()
+            if data.get("Response") == "True":
+                return data
+            # OMDb meldet auch Key-/Limit-Fehler mit HTTP 200 - nur "not found" ist ein echter Miss
+            error = data.get("Error", "")
+            if "not found" not in error.lower():
+                raise MetadataRequestError(error or "Unbekannter Fehler")
                     
         except Exception as e:
-            print(f"[OMDb] Suche fehlgeschlagen: {e}")
+            log.warning("[OMDb] Suche fehlgeschlagen: %s", e)
+            if raise_errors:
+                raise MetadataRequestError(f"OMDb: {e}") from e
         
         return None
     
@@ -275,39 +314,32 @@ class OMDbFetcher:
         """Formatiert OMDb-Ergebnis für MediaBrain."""
         if not omdb_data:
             return None
-            
+
+        get = omdb_data.get
         result = {
-            "title": omdb_data.get("Title"),
-            "description": omdb_data.get("Plot"),
-            "imdb_id": omdb_data.get("imdbID"),
-            "year": omdb_data.get("Year"),
-            "source": "omdb"
+            key: (value if (value := get(src)) and value != "N/A" else None)
+            for key, src in self._FIELDS.items()
         }
+        result["source"] = "omdb"
         
         # Typ
-        media_type = omdb_data.get("Type", "movie")
-        result["type"] = "series" if media_type == "series" else "movie"
+        result["type"] = "series" if get("Type", "movie") == "series" else "movie"
         
         # Poster
-        poster = omdb_data.get("Poster")
+        poster = get("Poster")
         if poster and poster != "N/A":
             result["thumbnail_url"] = poster
         
         # Rating
-        rating = omdb_data.get("imdbRating")
+        rating = get("imdbRating")
         if rating and rating != "N/A":
             result["rating"] = float(rating)
         
         # Genres
-        genres = omdb_data.get("Genre")
+        genres = get("Genre")
         if genres and genres != "N/A":
             result["genres"] = [g.strip() for g in genres.split(",")]
         
-        # Weitere Infos
-        result["director"] = omdb_data.get("Director") if omdb_data.get("Director") != "N/A" else None
-        result["actors"] = omdb_data.get("Actors") if omdb_data.get("Actors") != "N/A" else None
-        result["runtime"] = omdb_data.get("Runtime") if omdb_data.get("Runtime") != "N/A" else None
-        
         return result
 
 # ============================================================
@@ -336,12 +368,12 @@ class MusicBrainzFetcher:
                     return data["artists"][0]
                     
         except Exception as e:
-            print(f"[MusicBrainz] Suche fehlgeschlagen: {e}")
+            log.warning("[MusicBrainz] Suche fehlgeschlagen: %s", e)
         
         return None
     
-    def search_release(self, title, artist=None):
-        """Sucht nach einem Album/Release."""
+    def search_release(self, title, artist=None, raise_errors=False):
+        """Sucht nach einem Album/Release. Mit raise_errors=True wirft ein Fehlschlag MetadataRequestError."""
         try:
             query = f'release:"{title}"'
             if artist:
@@ -354,13 +386,16 @@ class MusicBrainzFetcher:
                 timeout=5
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("releases"):
-                    return data["releases"][0]
+            if response.status_code != 200:
+                raise MetadataRequestError(f"HTTP {response.status_code}")
+            data = response.json()
+            if data.get("releases"):
+                return data["releases"][0]
                     
         except Exception as e:
-            print(f"[MusicBrainz] Release-Suche fehlgeschlagen: {e}")
+            log.warning("[MusicBrainz] Release-Suche fehlgeschlagen: %s", e)
+            if raise_errors:
+                raise MetadataRequestError(f"MusicBrainz: {e}") from e
         
         return None
     
@@ -379,8 +414,8 @@ class MusicBrainzFetcher:
                 if images:
                     return images[0].get("image")
                     
-        except:
-            pass
+        except Exception as e:
+            log.debug("[MusicBrainz] Cover-Art fehlgeschlagen: %s", e)
         
         return None
 
@@ -389,28 +424,45 @@ class MusicBrainzFetcher:
 # ============================================================
 
 class MetadataCache:
-    """SQLite-basierter Cache fuer Metadaten-API-Antworten."""
+    """SQLite-basierter Cache fuer Metadaten-API-Antworten.
+
+    Haelt eine einzige Verbindung offen (autocommit), damit sqlite3 die
+    vorbereiteten Statements wiederverwenden kann. Zugriffe sind per Lock
+    serialisiert, da der Fetcher auch aus Worker-Threads genutzt wird.
+    """
 
     DEFAULT_TTL_DAYS = 30
+    MISS_TTL_DAYS = 0.25  # Negativ-Treffer (nichts gefunden) nur 6 Stunden cachen
+
+    # Feste SQL-Strings -> Treffer im Statement-Cache der Verbindung
+    _SQL_GET = "SELECT result_json, expires_at FROM metadata_cache WHERE cache_key = ?"
+    _SQL_PUT = "INSERT OR REPLACE INTO metadata_cache (cache_key, result_json, created_at, expires_at) VALUES (?, ?, ?, ?)"
+    _SQL_DELETE = "DELETE FROM metadata_cache WHERE cache_key = ?"
+    _SQL_EXPIRE = "DELETE FROM metadata_cache WHERE expires_at < ?"
 
     def __init__(self, db_path=None):
-        if db_path is None:
-            db_path = Path(__file__).parent / "metadata_cache.db"
-        self.db_path = str(db_path)
+        self.db_path = str(db_path) if db_path is not None else _DEFAULT_DB_PATH
+        self._lock = threading.Lock()
+        self._conn = None
         self._setup()
 
+    def _connect(self):
+        """Gibt die (lazy geoeffnete) gemeinsame Verbindung zurueck. Aufruf nur unter self._lock."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA cache_size=-16384")  # 16 MB Page-Cache
+        return self._conn
+
     def _setup(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS metadata_cache (
-                cache_key TEXT PRIMARY KEY,
-                result_json TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                expires_at TEXT NOT NULL
-            )
-        """)
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._connect().execute("""
+                CREATE TABLE IF NOT EXISTS metadata_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    result_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL
+                )
+            """)
 
     @staticmethod
     def _make_key(source, query, media_type=None, year=None, artist=None):
@@ -420,12 +472,8 @@ class MetadataCache:
 
     def get(self, source, query, media_type=None, year=None, artist=None):
         key = self._make_key(source, query, media_type, year, artist)
-        conn = sqlite3.connect(self.db_path)
-        row = conn.execute(
-            "SELECT result_json, expires_at FROM metadata_cache WHERE cache_key = ?",
-            (key,)
-        ).fetchone()
-        conn.close()
+        with self._lock:
+            row = self._connect().execute(self._SQL_GET, (key,)).fetchone()
 
         if row is None:
             return None
@@ -437,47 +485,115 @@ class MetadataCache:
         return json.loads(row[0])
 
     def put(self, source, query, result, media_type=None, year=None, artist=None, ttl_days=None):
-        if result is None:
-            return
         key = self._make_key(source, query, media_type, year, artist)
         now = datetime.now()
         expires = now + timedelta(days=ttl_days or self.DEFAULT_TTL_DAYS)
-        conn = sqlite3.connect(self.db_path)
-        conn.execute(
-            "INSERT OR REPLACE INTO metadata_cache (cache_key, result_json, created_at, expires_at) VALUES (?, ?, ?, ?)",
-            (key, json.dumps(result, ensure_ascii=False), now.isoformat(), expires.isoformat())
-        )
-        conn.commit()
-        conn.close()
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._connect().execute(self._SQL_PUT, (key, payload, now.isoformat(), expires.isoformat()))
 
     def delete(self, key):
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("DELETE FROM metadata_cache WHERE cache_key = ?", (key,))
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._connect().execute(self._SQL_DELETE, (key,))
 
     def clear_expired(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("DELETE FROM metadata_cache WHERE expires_at < ?", (datetime.now().isoformat(),))
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._connect().execute(self._SQL_EXPIRE, (datetime.now().isoformat(),))
+
+    def close(self):
+        """Schliesst die Cache-Verbindung (wird bei Bedarf neu geoeffnet)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
 
 # ============================================================
 # 6. Unified Metadata Fetcher
 # ============================================================
 
+# Cache-Marker fuer "bekannter Fehlschlag" (gespeichert als {"__miss__": True})
+CACHED_MISS = object()
+
 class MetadataFetcher:
     """
     Einheitlicher Metadaten-Fetcher für MediaBrain.
     Kombiniert alle Quellen mit Fallback-Logik.
     """
+
+    # Maximale Wartezeit (Sekunden) auf nachgeladene Cover-Art bei wait_for_cover=True
+    COVER_WAIT_TIMEOUT = 10
     
     def __init__(self, cache_enabled=True):
         self.tmdb = TMDbFetcher()
         self.omdb = OMDbFetcher()
         self.musicbrainz = MusicBrainzFetcher()
         self.cache = MetadataCache() if cache_enabled else None
+        # Hintergrund-Pool fuer optionale Nachlade-Requests (z.B. Cover-Art)
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="MetadataFetcher")
+        # Laufende Abfragen je Cache-Key (Request-Deduplizierung)
+        self._inflight: dict[str, Future] = {}
+        # Laufende Cover-Art-Nachladungen je Cache-Key
+        self._cover_fills: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def keys_changed(self):
+        """Prüft, ob sich die API-Keys (Umgebung/settings.json) seit dem Erstellen geändert haben."""
+        return (self.tmdb.api_key, self.omdb.api_key) != (get_api_key("tmdb"), get_api_key("omdb"))
+
+    def close(self):
+        """Beendet den Hintergrund-Pool und schliesst den Cache.
+
+        Laufende Cover-Nachladungen dürfen noch zu Ende laufen; neue werden
+        danach nicht mehr gestartet.
+        """
+        self._pool.shutdown(wait=False)
+        if self.cache:
+            self.cache.close()
+
+    def _deduplicated(self, key, fetch, *args):
+        """
+        Fuehrt fetch(*args) aus, sofern nicht bereits eine Abfrage fuer key laeuft.
+
+        Parallele Aufrufer mit gleichem Key (z.B. zwei Detail-Ansichten fuer
+        dasselbe Medium) warten auf das Ergebnis der ersten Abfrage statt
+        die APIs erneut anzufragen.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    @staticmethod
+    def _ask(search, *args):
+        """
+        Fragt eine Quelle an und unterscheidet "kein Treffer" von "fehlgeschlagen".
+
+        Returns:
+            (Treffer oder None, True falls die Anfrage gescheitert ist)
+        """
+        try:
+            return search(*args, raise_errors=True), False
+        except MetadataRequestError:
+            # Bereits von der Quelle geloggt
+            return None, True
 
     def _cache_get(self, source, query, media_type=None, year=None, artist=None):
         """
@@ -491,15 +607,22 @@ class MetadataFetcher:
             artist: Künstler für Musik (optional)
 
         Returns:
-            Gecachte Metadaten oder None
+            Gecachte Metadaten, CACHED_MISS fuer einen gecachten Fehlschlag oder None
         """
         if self.cache:
-            return self.cache.get(source, query, media_type, year, artist)
+            cached = self.cache.get(source, query, media_type, year, artist)
+            if isinstance(cached, dict) and cached.get("__miss__"):
+                return CACHED_MISS
+            return cached
         return None
 
     def _cache_put(self, source, query, result, media_type=None, year=None, artist=None):
         """
-        Speichert Metadaten in Cache (falls aktiviert und result nicht None).
+        Speichert Metadaten in Cache (falls aktiviert).
+        Ein leeres Ergebnis wird mit kurzer TTL als Fehlschlag gecacht,
+        damit wiederholte Fehlversuche nicht erneut die APIs abfragen.
+        Aufrufer speichern Fehlschläge nur, wenn tatsächlich eine API gefragt wurde
+        und keine der Anfragen gescheitert ist.
 
         Args:
             source: Quelle (movie, series, music)
@@ -509,19 +632,32 @@ class MetadataFetcher:
             year: Jahr (optional)
             artist: Künstler für Musik (optional)
         """
-        if self.cache and result:
+        if not self.cache:
+            return
+        if result:
             self.cache.put(source, query, result, media_type, year, artist)
+        else:
+            self.cache.put(source, query, {"__miss__": True}, media_type, year, artist,
+                           ttl_days=MetadataCache.MISS_TTL_DAYS)
 
     def fetch_movie(self, title, year=None):
         """Holt Film-Metadaten (Cache → TMDb → OMDb Fallback)."""
+        key = MetadataCache._make_key("movie", title, "movie", str(year) if year else None)
+        return self._deduplicated(key, self._fetch_movie, title, year)
+
+    def _fetch_movie(self, title, year):
         cached = self._cache_get("movie", title, "movie", str(year) if year else None)
+        if cached is CACHED_MISS:
+            return None
         if cached:
             return cached
 
         result = None
+        queried = failed = False
         # 1. TMDb versuchen
         if self.tmdb.is_available():
-            raw = self.tmdb.search_movie(title, year)
+            queried = True
+            raw, failed = self._ask(self.tmdb.search_movie, title, year)
             if raw:
                 details = self.tmdb.get_movie_details(raw["id"])
                 if details:
@@ -531,58 +667,139 @@ class MetadataFetcher:
 
         # 2. OMDb Fallback
         if result is None and self.omdb.is_available():
-            raw = self.omdb.search(title, year, "movie")
+            queried = True
+            raw, omdb_failed = self._ask(self.omdb.search, title, year, "movie")
+            failed = failed or omdb_failed
             if raw:
                 result = self.omdb.format_result(raw)
 
-        self._cache_put("movie", title, result, "movie", str(year) if year else None)
+        # Ohne API-Key oder bei gescheiterter Anfrage keinen Fehlschlag cachen
+        if result is not None or (queried and not failed):
+            self._cache_put("movie", title, result, "movie", str(year) if year else None)
         return result
 
     def fetch_series(self, title, year=None):
         """Holt Serien-Metadaten (Cache → TMDb → OMDb Fallback)."""
+        key = MetadataCache._make_key("series", title, "series", str(year) if year else None)
+        return self._deduplicated(key, self._fetch_series, title, year)
+
+    def _fetch_series(self, title, year):
         cached = self._cache_get("series", title, "series", str(year) if year else None)
+        if cached is CACHED_MISS:
+            return None
         if cached:
             return cached
 
         result = None
+        queried = failed = False
         # 1. TMDb
         if self.tmdb.is_available():
-            raw = self.tmdb.search_tv(title, year)
+            queried = True
+            raw, failed = self._ask(self.tmdb.search_tv, title, year)
             if raw:
                 result = self.tmdb.format_result(raw, "series")
 
         # 2. OMDb Fallback
         if result is None and self.omdb.is_available():
-            raw = self.omdb.search(title, year, "series")
+            queried = True
+            raw, omdb_failed = self._ask(self.omdb.search, title, year, "series")
+            failed = failed or omdb_failed
             if raw:
                 result = self.omdb.format_result(raw)
 
-        self._cache_put("series", title, result, "series", str(year) if year else None)
+        if result is not None or (queried and not failed):
+            self._cache_put("series", title, result, "series", str(year) if year else None)
+        return result
+
+    def fetch_music(self, title, artist=None, wait_for_cover=False):
+        """
+        Holt Musik-Metadaten (Cache → MusicBrainz).
+
+        Die Cover-Art wird im Hintergrund nachgeladen: der erste Aufruf liefert
+        thumbnail_url=None, folgende Aufrufe erhalten sie aus dem Cache.
+        Mit wait_for_cover=True (z.B. wenn das Ergebnis gespeichert wird)
+        wartet der Aufruf bis zu COVER_WAIT_TIMEOUT Sekunden auf das Cover.
+        """
+        key = MetadataCache._make_key("music", title, "music", artist=artist)
+        result = self._deduplicated(key, self._fetch_music, title, artist)
+        if wait_for_cover and result and not result.get("thumbnail_url"):
+            cover_url = self._wait_for_cover(key, title, artist)
+            if cover_url:
+                result = dict(result, thumbnail_url=cover_url)
         return result
 
-    def fetch_music(self, title, artist=None):
-        """Holt Musik-Metadaten (Cache → MusicBrainz)."""
+    def _wait_for_cover(self, key, title, artist):
+        """Wartet auf eine laufende Cover-Nachladung oder liest das Cover aus dem Cache."""
+        with self._lock:
+            future = self._cover_fills.get(key)
+        if future is not None:
+            try:
+                return future.result(timeout=self.COVER_WAIT_TIMEOUT)
+            except Exception as e:
+                log.warning("[MetadataFetcher] Cover-Art nicht verfügbar: %s", e)
+                return None
+        # Nachladung bereits abgeschlossen -> Ergebnis steht im Cache
         cached = self._cache_get("music", title, "music", artist=artist)
+        if isinstance(cached, dict):
+            return cached.get("thumbnail_url")
+        return None
+
+    def _fetch_music(self, title, artist):
+        cached = self._cache_get("music", title, "music", artist=artist)
+        if cached is CACHED_MISS:
+            return None
         if cached:
             return cached
 
-        raw = self.musicbrainz.search_release(title, artist)
+        raw, failed = self._ask(self.musicbrainz.search_release, title, artist)
         result = None
+        release_id = None
         if raw:
             release_id = raw.get("id")
             result = {
                 "title": raw.get("title"),
                 "artist": raw.get("artist-credit", [{}])[0].get("name"),
                 "year": raw.get("date", "")[:4] if raw.get("date") else None,
-                "thumbnail_url": self.musicbrainz.get_cover_art(release_id) if release_id else None,
+                "thumbnail_url": None,
                 "type": "music",
                 "source": "musicbrainz"
             }
-
-        self._cache_put("music", title, result, "music", artist=artist)
+            # Ohne Cache gibt es keinen Ort zum Nachtragen -> synchron holen
+            if release_id and not self.cache:
+                result["thumbnail_url"] = self.musicbrainz.get_cover_art(release_id)
+
+        # Gescheiterte Anfrage nicht als Miss cachen
+        if result is not None or not failed:
+            self._cache_put("music", title, result, "music", artist=artist)
+
+        # Cover-Art erst NACH dem Cache-Eintrag im Hintergrund nachladen,
+        # damit der zweite Request nicht die Antwortzeit verdoppelt
+        if result and release_id and self.cache:
+            key = MetadataCache._make_key("music", title, "music", artist=artist)
+            try:
+                future = self._pool.submit(self._fill_cover_art, title, artist, release_id, result)
+            except RuntimeError:
+                # Fetcher wurde bereits geschlossen (z.B. nach Key-Änderung ersetzt)
+                log.debug("[MetadataFetcher] Pool geschlossen, Cover-Art wird nicht nachgeladen")
+                return result
+            with self._lock:
+                self._cover_fills[key] = future
+            future.add_done_callback(lambda f: self._forget_cover_fill(key, f))
         return result
 
-    def auto_fetch(self, title, media_type="movie", year=None, artist=None):
+    def _forget_cover_fill(self, key, future):
+        with self._lock:
+            if self._cover_fills.get(key) is future:
+                del self._cover_fills[key]
+
+    def _fill_cover_art(self, title, artist, release_id, result):
+        """Holt Cover-Art nachtraeglich und aktualisiert den Cache-Eintrag."""
+        cover_url = self.musicbrainz.get_cover_art(release_id)
+        if cover_url:
+            self._cache_put("music", title, dict(result, thumbnail_url=cover_url), "music", artist=artist)
+        return cover_url
+
+    def auto_fetch(self, title, media_type="movie", year=None, artist=None, wait_for_cover=False):
         """
         Automatischer Fetch basierend auf Medientyp.
         
@@ -591,13 +808,14 @@ class MetadataFetcher:
             media_type: movie, series, music, clip
             year: Erscheinungsjahr (optional)
             artist: Künstler für Musik (optional)
+            wait_for_cover: Musik-Cover synchron abwarten (für Aufrufer, die speichern)
         """
         if media_type in ["movie", "film"]:
             return self.fetch_movie(title, year)
         elif media_type in ["series", "show", "tv"]:
             return self.fetch_series(title, year)
         elif media_type in ["music", "song", "album"]:
-            return self.fetch_music(title, artist)
+            return self.fetch_music(title, artist, wait_for_cover=wait_for_cover)
         else:
             # Versuche Film zuerst
             result = self.fetch_movie(title, year)
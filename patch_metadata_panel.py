@@ -18,11 +18,11 @@ def patch():
     # 1. NEUE IMPORTS: Am Anfang nach "from pathlib import Path" einfuegen
     old_import = "from pathlib import Path"
     new_import = """from pathlib import Path
-from threading import Thread"""
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal"""
     
-    if "from threading import Thread" not in content:
+    if "QRunnable" not in content:
         content = content.replace(old_import, new_import)
-        print("[OK] Thread-Import hinzugefuegt")
+        print("[OK] ThreadPool-Imports hinzugefuegt")
     
     # 2. MediaDetailView komplett ersetzen
     # Original MediaDetailView finden und ersetzen
@@ -97,7 +97,51 @@ from threading import Thread"""
         from MediaBrain import controller
         controller.notify_data_changed()'''
     
-    new_class = '''class MediaDetailView(QWidget):
+    new_class = '''# Gemeinsamer Thread-Pool fuer Online-Metadaten (begrenzte Parallelitaet)
+_pool = QThreadPool.globalInstance()
+
+
+class MetadataWorkerSignals(QObject):
+    """Signale des MetadataWorker (QRunnable selbst kann keine Signale haben)."""
+    finished = pyqtSignal(object)
+
+
+class MetadataWorker(QRunnable):
+    """Holt Online-Metadaten fuer ein MediaItem im Thread-Pool.
+
+    Bereitet auch die gekuerzte Beschreibung vor, damit der GUI-Thread
+    nur noch Labels setzen muss.
+    """
+
+    DESCRIPTION_PREVIEW_LEN = 500
+
+    def __init__(self, item):
+        super().__init__()
+        self.item = item
+        self.signals = MetadataWorkerSignals()
+
+    def run(self):
+        try:
+            fetcher = get_fetcher()
+            result = fetcher.auto_fetch(
+                title=self.item.title,
+                media_type=self.item.type,
+                year=getattr(self.item, 'year', None),
+                artist=getattr(self.item, 'artist', None)
+            )
+            description = result.get("description") if result else None
+            if description:
+                # Kopie - das Ergebnis kann aus dem Cache des Fetchers stammen
+                if len(description) > self.DESCRIPTION_PREVIEW_LEN:
+                    description = description[:self.DESCRIPTION_PREVIEW_LEN] + "..."
+                result = dict(result, description_preview=description)
+        except Exception as e:
+            result = {"error": str(e)}
+        # Zustellung ueber das Signal -> Slot laeuft im Main-Thread
+        self.signals.finished.emit(result)
+
+
+class MediaDetailView(QWidget):
     """Detailansicht fuer ein Medium - zeigt alle verfuegbaren Metadaten."""
     
     def __init__(self, item: MediaItem, media_manager: MediaManager, blacklist_manager: BlacklistManager, back_callback):
@@ -181,7 +225,7 @@ from threading import Thread"""
         btn_row.addWidget(fav_btn)
         
         fetch_btn = QPushButton("🌐 Metadaten aktualisieren")
-        fetch_btn.clicked.connect(self._fetch_and_save_metadata)
+        fetch_btn.clicked.connect(lambda: self._fetch_and_save_metadata())
         btn_row.addWidget(fetch_btn)
 
         back_btn = QPushButton("Zurueck")
@@ -194,33 +238,10 @@ from threading import Thread"""
         layout.addStretch()
 
     def _load_online_metadata(self):
-        """Laedt Online-Metadaten asynchron."""
-        def fetch():
-            try:
-                from metadata_v2 import MetadataFetcher
-                fetcher = MetadataFetcher()
-                result = fetcher.auto_fetch(
-                    title=self.item.title,
-                    media_type=self.item.type,
-                    year=getattr(self.item, 'year', None),
-                    artist=getattr(self.item, 'artist', None)
-                )
-                # UI im Main-Thread aktualisieren
-                from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-                QMetaObject.invokeMethod(
-                    self, "_update_online_metadata",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(object, result)
-                )
-            except Exception as e:
-                from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-                QMetaObject.invokeMethod(
-                    self, "_update_online_metadata",
-                    Qt.ConnectionType.QueuedConnection,
-                    Q_ARG(object, {"error": str(e)})
-                )
-        
-        Thread(target=fetch, daemon=True).start()
+        """Laedt Online-Metadaten asynchron ueber den gemeinsamen Thread-Pool."""
+        worker = MetadataWorker(self.item)
+        worker.signals.finished.connect(self._update_online_metadata)
+        _pool.start(worker)
     
     def _update_online_metadata(self, result):
         """Aktualisiert die Online-Metadaten-Anzeige."""
@@ -262,57 +283,60 @@ from threading import Thread"""
             self.online_meta_container.addWidget(label)
         
         # Beschreibung separat (falls laenger)
-        if result.get("description") and result["description"] != self.item.description:
+        if result.get("description_preview") and result["description"] != self.item.description:
             desc_label = QLabel("Online-Beschreibung:")
             desc_label.setStyleSheet("font-weight: bold; margin-top: 10px; padding-left: 10px;")
             self.online_meta_container.addWidget(desc_label)
             
-            desc = QLabel(result["description"][:500] + "..." if len(result.get("description", "")) > 500 else result.get("description", ""))
+            desc = QLabel(result["description_preview"])
             desc.setWordWrap(True)
             desc.setStyleSheet("padding-left: 20px; color: #555;")
             self.online_meta_container.addWidget(desc)
 
-    def _fetch_and_save_metadata(self):
-        """Holt Metadaten und speichert sie in der Datenbank."""
+    def _fetch_and_save_metadata(self, items=None):
+        """Holt Metadaten und speichert sie in der Datenbank.
+
+        Args:
+            items: Liste von MediaItems (Standard: nur das angezeigte Item).
+                   Alle Updates laufen in einer Transaktion via executemany.
+        """
         from PyQt6.QtWidgets import QMessageBox
+        items = items or [self.item]
         try:
-            from metadata_v2 import MetadataFetcher
-            fetcher = MetadataFetcher()
-            result = fetcher.auto_fetch(
-                title=self.item.title,
-                media_type=self.item.type
-            )
+            fetcher = get_fetcher()
+            rows = []
+            sources = set()
+            for item in items:
+                result = fetcher.auto_fetch(
+                    title=item.title,
+                    media_type=item.type,
+                    wait_for_cover=True
+                )
+                if not result:
+                    continue
+                if not (result.get("description") or result.get("thumbnail_url")):
+                    continue
+                # None behaelt bestehende Werte, wenn das Ergebnis ein Feld nicht liefert
+                rows.append((
+                    result.get("description") or None,
+                    result.get("thumbnail_url") or None,
+                    item.id
+                ))
+                sources.add(result.get("source", "unbekannt"))
             
-            if not result:
-                QMessageBox.information(self, "Keine Daten", "Keine Online-Metadaten gefunden.")
+            if not rows:
+                QMessageBox.information(self, "Keine Daten", "Keine neuen Online-Metadaten gefunden.")
                 return
             
-            # DB Update
-            updates = []
-            params = []
+            # DB Update: ein Statement, eine Transaktion, ein Commit
+            self.media_manager.update_metadata_many(rows)
             
-            if result.get("description"):
-                updates.append("description = ?")
-                params.append(result["description"])
-            if result.get("thumbnail_url"):
-                updates.append("thumbnail_url = ?")
-                params.append(result["thumbnail_url"])
-            if result.get("rating"):
-                updates.append("rating = ?")
-                params.append(result["rating"])
+            QMessageBox.information(self, "Gespeichert", 
+                f"Metadaten fuer {len(rows)} Eintrag/Eintraege aktualisiert. "
+                f"Quelle: {', '.join(sorted(sources))}")
             
-            if updates:
-                params.append(self.item.id)
-                query = f"UPDATE media_items SET {', '.join(updates)} WHERE id = ?"
-                self.media_manager.db.execute(query, tuple(params))
-                
-                QMessageBox.information(self, "Gespeichert", 
-                    f"Metadaten aktualisiert. Quelle: {result.get('source', 'unbekannt')}")
-                
-                from MediaBrain import controller
-                controller.notify_data_changed()
-            else:
-                QMessageBox.information(self, "Keine Aenderungen", "Keine neuen Daten zum Speichern.")
+            from MediaBrain import controller
+            controller.notify_data_changed()
                 
         except Exception as e:
             QMessageBox.warning(self, "Fehler", f"Fehler beim Abrufen: {e}")
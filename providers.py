@@ -3,8 +3,83 @@ providers.py
 Erkennt Medien anhand von URL oder Fenstertitel.
 Version: 2.0 - Erweitert mit Disney+, Amazon Prime, Apple TV+
 """
+import logging
+import os
 import re
+import stat
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+
+# Optional: Aho-Corasick-Automat für die Schlüsselwort-Suche (pyahocorasick)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional: RE2 (google-re2) für die kombinierte URL-Regex (lineare Laufzeit, C++)
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Kind-Logger des App-Loggers (logger_system) - Treffer nur auf DEBUG-Level
+log = logging.getLogger("MediaBrain.providers")
+
+# Titel eigener Fenster enthalten diesen Marker (verhindert Selbst-Erkennung)
+SELF_MARKER = "MediaBrain"
+
+# Beschreibung für title-basierte Treffer (ohne echte Provider-ID)
+_AUTO_DESC = sys.intern("Automatisch erkannt (Browser)")
+
+
+class MediaInfo(NamedTuple):
+    """
+    Kompakte, unveränderliche Form eines Erkennungs-Ergebnisses.
+
+    Wird im Erkennungs-Cache der Registry gehalten; nach außen liefert
+    ProviderRegistry.identify() weiterhin ein Dict (siehe to_dict()).
+    """
+    title: str
+    type: str
+    source: str
+    provider_id: str
+    has_real_id: bool
+    description: str | None = None
+    thumbnail_url: str | None = None
+    channel: str | None = None
+    is_local_file: bool | None = None
+    local_path: str | None = None
+
+    def to_dict(self) -> dict:
+        """Dict wie von extract_info() - ohne nicht gesetzte Felder."""
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
+
+
+def build_fallback(title: str, type_: str, source: str, description: str = _AUTO_DESC) -> dict:
+    """
+    Baut das Ergebnis-Dict für einen title-basierten Treffer (Fallback ohne URL-ID).
+
+    Args:
+        title: Bereinigter Titel (dient auch als provider_id)
+        type_: Medientyp (z.B. "movie", "music", "clip")
+        source: source-ID des Providers
+        description: Beschreibungstext
+
+    Returns:
+        Dict mit Medien-Daten
+    """
+    return {
+        "title": title,
+        "type": type_,
+        "source": source,
+        "provider_id": title,
+        "description": description,
+        "has_real_id": False
+    }
 
 # ============================================================
 # Basis-Klasse
@@ -16,26 +91,53 @@ class BaseProvider:
     Jeder Provider muss matches() und extract_info() implementieren.
     Optional können get_browser_url() und get_deep_link() überschrieben werden.
 
+    Provider sind zustandslos: alle Methoden sind Klassenmethoden, die
+    Registry arbeitet direkt mit den Klassen (keine Instanzen nötig).
+
     Attributes:
         name: Anzeigename des Providers (z.B. "Netflix", "YouTube")
         source: Interne Quelle-ID für die Datenbank (z.B. "netflix", "youtube")
     """
     name = "base"
     source = "unknown"
+    regex = None              # URL-Muster mit der Provider-ID als Gruppe
+    keywords = ()             # Titel-Schlüsselwörter (Groß-/Kleinschreibung beachten)
+    keywords_ci = ()          # Schlüsselwörter ohne Groß-/Kleinschreibung (z.B. Domains)
+    keyword_excludes = ()     # Phrasen, die einen Keyword-Treffer aufheben
+    clean_phrases = ()        # Fallback-Titel wird an diesen Phrasen abgeschnitten
+    _OVERVIEW = frozenset()   # Titel, die zu "[Provider] Übersicht" werden
 
-    def matches(self, source_string: str) -> bool:
+    @classmethod
+    def matches(cls, source_string: str) -> bool:
         """
         Prüft, ob der source_string zu diesem Provider gehört.
 
+        Standard: URL-Regex oder Schlüsselwort im Fenstertitel.
+
         Args:
             source_string: URL, Fenstertitel oder Dateipfad
 
         Returns:
             True wenn der Provider zuständig ist, sonst False
         """
-        raise NotImplementedError
+        if cls.regex is not None and cls.regex.search(source_string):
+            return True
+        return cls.matches_keywords(source_string)
+
+    @classmethod
+    def matches_keywords(cls, source_string: str) -> bool:
+        """Prüft nur die Titel-Schlüsselwörter (inkl. Ausschluss-Phrasen)."""
+        if any(k in source_string for k in cls.keyword_excludes):
+            return False
+        if any(k in source_string for k in cls.keywords):
+            return True
+        if cls.keywords_ci:
+            lowered = source_string.lower()
+            return any(k in lowered for k in cls.keywords_ci)
+        return False
 
-    def extract_info(self, source_string: str) -> dict:
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
         """
         Extrahiert Medien-Informationen aus dem source_string.
 
@@ -48,7 +150,8 @@ class BaseProvider:
         """
         raise NotImplementedError
 
-    def get_browser_url(self, provider_id: str) -> str | None:
+    @classmethod
+    def get_browser_url(cls, provider_id: str) -> str | None:
         """
         Generiert Browser-URL aus provider_id (falls möglich).
 
@@ -60,7 +163,8 @@ class BaseProvider:
         """
         return None
 
-    def get_deep_link(self, provider_id: str) -> str | None:
+    @classmethod
+    def get_deep_link(cls, provider_id: str) -> str | None:
         """
         Generiert App Deep-Link aus provider_id (falls möglich).
 
@@ -72,39 +176,62 @@ class BaseProvider:
         """
         return None
 
-    def _build_fallback_result(self, source_string: str, clean_phrases: list, default_type: str, overview_names: list = None) -> dict | None:
+    @classmethod
+    def _build_id_result(cls, title: str, media_type: str, provider_id: str, **extra) -> dict:
+        """
+        Helper für URL-basierte Treffer (echte Provider-ID).
+
+        Args:
+            title: Anzeigetitel
+            media_type: Medientyp (z.B. "movie", "music", "clip")
+            provider_id: ID aus der URL
+            **extra: Zusätzliche Felder (z.B. thumbnail_url, channel)
+
+        Returns:
+            Dict mit Medien-Daten
+        """
+        result = {
+            "title": title,
+            "type": media_type,
+            "source": cls.source,
+            "provider_id": provider_id,
+            "has_real_id": True
+        }
+        if extra:
+            result.update(extra)
+        return result
+
+    @classmethod
+    def _build_fallback_result(cls, source_string: str, default_type: str) -> dict | None:
         """
         Helper für title-basierte Erkennung (Fallback wenn keine URL-ID).
 
         Args:
-            source_string: Fenstertitel
-            clean_phrases: Liste von Phrasen die entfernt werden sollen (z.B. [" - Netflix"])
+            source_string: Fenstertitel (bereinigt mit den clean_phrases des Providers)
             default_type: Medientyp (z.B. "movie", "music", "clip")
-            overview_names: Namen die zu "[Provider] Übersicht" werden (optional)
 
         Returns:
             Dict mit Medien-Daten oder None
         """
-        title = clean_window_title(source_string, clean_phrases)
+        title = clean_window_title(source_string, cls.clean_phrases)
         if not title:
             return None
 
-        # Übersicht-Check
-        if overview_names and title in overview_names:
-            title = f"{self.name} Übersicht"
+        # Übersicht-Check (_OVERVIEW ist immer ein frozenset, ggf. leer)
+        if title in cls._OVERVIEW:
+            title = f"{cls.name} Übersicht"
 
-        return {
-            "title": title,
-            "type": default_type,
-            "source": self.source,
-            "provider_id": title,
-            "description": "Automatisch erkannt (Browser)",
-            "has_real_id": False
-        }
+        return build_fallback(title, default_type, cls.source)
 
 # ============================================================
 # Helper: Titel bereinigen
 # ============================================================
+_MULTI_TAB_RE = re.compile(r" und \d+ weitere Seiten")
+# Generische Browser-Endungen (inkl. Zero-Width-Space im Edge-Titel).
+# Reihenfolge: erst der Browsername, dann das davorstehende Edge-Profil.
+_BROWSER_SUFFIXES = (" - Microsoft\u200b Edge", " - Google Chrome", " - Mozilla Firefox", " - Persönlich")
+
+
 def clean_window_title(title, remove_phrases):
     """
     Bereinigt Fenstertitel von Browser-Suffixen und Metadaten.
@@ -123,27 +250,32 @@ def clean_window_title(title, remove_phrases):
         str: Bereinigter Titel oder None wenn MediaBrain-Fenster
     """
     # --- WICHTIG: Eigene App ignorieren ---
-    if "MediaBrain" in title:
+    if SELF_MARKER in title:
         return None
     # --------------------------------------
 
     # "und X weitere Seiten" entfernen
-    title = re.sub(r" und \d+ weitere Seiten", "", title)
+    title = _MULTI_TAB_RE.sub("", title)
 
     # Browser-Müll entfernen (alles ab dem Trennzeichen)
     for phrase in remove_phrases:
         if phrase in title:
             title = title.split(phrase)[0]
 
-    # Generische Browser-Endungen kappen
-    for browser in [" - Persönlich", " - Microsoft​ Edge", " - Google Chrome", " - Mozilla Firefox"]:
-        title = title.split(browser)[0]
+    # Generische Browser-Endungen kappen (removesuffix kopiert nur bei Treffer)
+    for suffix in _BROWSER_SUFFIXES:
+        title = title.removesuffix(suffix)
 
     return title.strip()
 
 # ============================================================
 # 1. Netflix
 # ============================================================
+# URL-Muster als Modul-Konstanten; extract_info() ruft die gebundene
+# search-Methode direkt auf (kein cls.regex.search-Lookup pro Aufruf).
+_NETFLIX_URL_RE = re.compile(r"netflix\.com/watch/(\d+)", re.ASCII)
+_NETFLIX_URL_SEARCH = _NETFLIX_URL_RE.search
+
 class NetflixProvider(BaseProvider):
     """
     Netflix Media Provider.
@@ -156,33 +288,30 @@ class NetflixProvider(BaseProvider):
     """
     name = "Netflix"
     source = "netflix"
-    regex = re.compile(r"netflix\.com/watch/(\d+)")
-
-    def matches(self, source_string: str) -> bool:
-        return bool(self.regex.search(source_string)) or ("Netflix" in source_string and "Netflix Party" not in source_string)
+    regex = _NETFLIX_URL_RE
+    keywords = ("Netflix",)
+    keyword_excludes = ("Netflix Party",)
+    clean_phrases = (" - Netflix", " | Netflix")
+    _OVERVIEW = frozenset({"Netflix"})
 
-    def extract_info(self, source_string: str) -> dict:
-        match = self.regex.search(source_string)
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
+        match = _NETFLIX_URL_SEARCH(source_string)
         if match:
-            return {
-                "title": f"Netflix Inhalt {match.group(1)}",
-                "type": "movie",
-                "source": self.source,
-                "provider_id": match.group(1),
-                "has_real_id": True
-            }
+            return cls._build_id_result(f"Netflix Inhalt {match.group(1)}", "movie", match.group(1))
 
         # Fallback: Title-basierte Erkennung
-        return self._build_fallback_result(
+        return cls._build_fallback_result(
             source_string,
-            clean_phrases=[" - Netflix", " | Netflix"],
-            default_type="movie",
-            overview_names=["Netflix"]
+            default_type="movie"
         )
 
 # ============================================================
 # 2. YouTube
 # ============================================================
+_YOUTUBE_URL_RE = re.compile(r"youtube\.com/watch\?v=([A-Za-z0-9_-]+)", re.ASCII)
+_YOUTUBE_URL_SEARCH = _YOUTUBE_URL_RE.search
+
 class YouTubeProvider(BaseProvider):
     """
     YouTube Media Provider.
@@ -195,34 +324,32 @@ class YouTubeProvider(BaseProvider):
     """
     name = "YouTube"
     source = "youtube"
-    regex = re.compile(r"youtube\.com/watch\?v=([A-Za-z0-9_-]+)")
+    regex = _YOUTUBE_URL_RE
+    keywords = ("YouTube",)
+    clean_phrases = (" - YouTube",)
 
-    def matches(self, source_string: str) -> bool:
-        return bool(self.regex.search(source_string)) or ("YouTube" in source_string)
-
-    def extract_info(self, source_string: str) -> dict:
-        match = self.regex.search(source_string)
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
+        match = _YOUTUBE_URL_SEARCH(source_string)
         if match:
             pid = match.group(1)
-            return {
-                "title": f"YouTube Video {pid}",
-                "type": "clip",
-                "source": self.source,
-                "provider_id": pid,
-                "thumbnail_url": f"https://img.youtube.com/vi/{pid}/0.jpg",
-                "has_real_id": True
-            }
+            return cls._build_id_result(
+                f"YouTube Video {pid}", "clip", pid,
+                thumbnail_url=f"https://img.youtube.com/vi/{pid}/0.jpg"
+            )
 
         # Fallback: Title-basierte Erkennung
-        return self._build_fallback_result(
+        return cls._build_fallback_result(
             source_string,
-            clean_phrases=[" - YouTube"],
             default_type="clip"
         )
 
 # ============================================================
 # 3. Spotify
 # ============================================================
+_SPOTIFY_URL_RE = re.compile(r"open\.spotify\.com/(track|album|playlist)/([a-zA-Z0-9]+)", re.ASCII)
+_SPOTIFY_URL_SEARCH = _SPOTIFY_URL_RE.search
+
 class SpotifyProvider(BaseProvider):
     """
     Spotify Media Provider.
@@ -235,34 +362,30 @@ class SpotifyProvider(BaseProvider):
     """
     name = "Spotify"
     source = "spotify"
-    regex = re.compile(r"open\.spotify\.com/(track|album|playlist)/([a-zA-Z0-9]+)")
-    
-    def matches(self, s): 
-        return "Spotify" in s or bool(self.regex.search(s))
+    regex = _SPOTIFY_URL_RE
+    keywords = ("Spotify",)
+    clean_phrases = (" - Spotify", " | Spotify")
     
-    def extract_info(self, s):
-        match = self.regex.search(s)
+    @classmethod
+    def extract_info(cls, s):
+        match = _SPOTIFY_URL_SEARCH(s)
         if match:
             content_type = match.group(1)
             content_id = match.group(2)
-            return {
-                "title": f"Spotify {content_type.title()} {content_id[:8]}",
-                "type": "music",
-                "source": self.source,
-                "provider_id": content_id,
-                "has_real_id": True
-            }
+            return cls._build_id_result(f"Spotify {content_type.title()} {content_id[:8]}", "music", content_id)
 
         # Fallback: Title-basierte Erkennung
-        return self._build_fallback_result(
+        return cls._build_fallback_result(
             s,
-            clean_phrases=[" - Spotify", " | Spotify"],
             default_type="music"
         )
 
 # ============================================================
 # 4. Disney+ (NEU)
 # ============================================================
+_DISNEY_URL_RE = re.compile(r"disneyplus\.com/video/([a-zA-Z0-9-]+)", re.ASCII)
+_DISNEY_URL_SEARCH = _DISNEY_URL_RE.search
+
 class DisneyPlusProvider(BaseProvider):
     """
     Disney+ Media Provider.
@@ -273,38 +396,33 @@ class DisneyPlusProvider(BaseProvider):
     """
     name = "Disney+"
     source = "disney"
-    regex = re.compile(r"disneyplus\.com/video/([a-zA-Z0-9-]+)")
+    regex = _DISNEY_URL_RE
+    keywords = ("Disney+",)
+    keywords_ci = ("disneyplus",)
+    clean_phrases = (" - Disney+", " | Disney+", "Disney+ |")
+    _OVERVIEW = frozenset({"Disney+", "Disney Plus"})
 
-    def matches(self, source_string: str) -> bool:
-        return (
-            bool(self.regex.search(source_string)) or 
-            "Disney+" in source_string or 
-            "disneyplus" in source_string.lower()
-        )
-
-    def extract_info(self, source_string: str) -> dict:
-        match = self.regex.search(source_string)
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
+        match = _DISNEY_URL_SEARCH(source_string)
         if match:
             video_id = match.group(1)
-            return {
-                "title": f"Disney+ Video {video_id[:12]}",
-                "type": "movie",
-                "source": self.source,
-                "provider_id": video_id,
-                "has_real_id": True
-            }
+            return cls._build_id_result(f"Disney+ Video {video_id[:12]}", "movie", video_id)
 
         # Fallback: Title-basierte Erkennung
-        return self._build_fallback_result(
+        return cls._build_fallback_result(
             source_string,
-            clean_phrases=[" - Disney+", " | Disney+", "Disney+ |"],
-            default_type="movie",
-            overview_names=["Disney+", "Disney Plus"]
+            default_type="movie"
         )
 
 # ============================================================
 # 5. Amazon Prime Video (NEU)
 # ============================================================
+_PRIME_URL_RE = re.compile(
+    r"(?:primevideo\.com/detail|amazon\.[a-z]{2,6}/gp/video/detail)/([a-zA-Z0-9]+)", re.ASCII
+)
+_PRIME_URL_SEARCH = _PRIME_URL_RE.search
+
 class AmazonPrimeProvider(BaseProvider):
     """
     Amazon Prime Video Media Provider.
@@ -316,49 +434,35 @@ class AmazonPrimeProvider(BaseProvider):
     """
     name = "Amazon Prime"
     source = "prime"
-    regex = re.compile(r"primevideo\.com/detail/([a-zA-Z0-9]+)")
-    regex_watch = re.compile(r"amazon\.[a-z]+/gp/video/detail/([a-zA-Z0-9]+)")
-
-    def matches(self, source_string: str) -> bool:
-        return (
-            bool(self.regex.search(source_string)) or
-            bool(self.regex_watch.search(source_string)) or
-            "Prime Video" in source_string or
-            "primevideo" in source_string.lower()
-        )
+    regex = _PRIME_URL_RE
+    keywords = ("Prime Video",)
+    keywords_ci = ("primevideo",)
+    clean_phrases = (" - Prime Video", " | Prime Video", "Prime Video -")
+    _OVERVIEW = frozenset({"Prime Video", "Amazon Prime Video"})
 
-    def extract_info(self, source_string: str) -> dict:
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
         # URL-basierte Erkennung
-        match = self.regex.search(source_string) or self.regex_watch.search(source_string)
+        match = _PRIME_URL_SEARCH(source_string)
         if match:
             video_id = match.group(1)
-            return {
-                "title": f"Prime Video {video_id}",
-                "type": "movie",
-                "source": self.source,
-                "provider_id": video_id,
-                "has_real_id": True
-            }
+            return cls._build_id_result(f"Prime Video {video_id}", "movie", video_id)
         
-        title = clean_window_title(source_string, [" - Prime Video", " | Prime Video", "Prime Video -"])
+        title = clean_window_title(source_string, cls.clean_phrases)
         if not title:
             return None
 
-        if title in ["Prime Video", "Amazon Prime Video"]:
+        if title in cls._OVERVIEW:
             title = "Prime Video Übersicht"
-            
-        return {
-            "title": title,
-            "type": "movie",
-            "source": self.source,
-            "provider_id": title,
-            "description": "Automatisch erkannt (Browser)",
-            "has_real_id": False
-        }
+
+        return build_fallback(title, "movie", cls.source)
 
 # ============================================================
 # 6. Apple TV+ (NEU)
 # ============================================================
+_APPLETV_URL_RE = re.compile(r"tv\.apple\.com/[a-z]+/(?:movie|show|episode)/[^/]+/([a-z0-9]+)", re.ASCII)
+_APPLETV_URL_SEARCH = _APPLETV_URL_RE.search
+
 class AppleTVProvider(BaseProvider):
     """
     Apple TV+ Media Provider.
@@ -369,46 +473,30 @@ class AppleTVProvider(BaseProvider):
     """
     name = "Apple TV+"
     source = "appletv"
-    regex = re.compile(r"tv\.apple\.com/[a-z]+/(?:movie|show|episode)/[^/]+/([a-z0-9]+)")
+    regex = _APPLETV_URL_RE
+    keywords = ("Apple TV",)
+    keywords_ci = ("tv.apple.com",)
+    clean_phrases = (" - Apple TV+", " | Apple TV+", "Apple TV+ -")
+    _OVERVIEW = frozenset({"Apple TV+", "Apple TV"})
 
-    def matches(self, source_string: str) -> bool:
-        return (
-            bool(self.regex.search(source_string)) or
-            "Apple TV" in source_string or
-            "tv.apple.com" in source_string.lower()
-        )
-
-    def extract_info(self, source_string: str) -> dict:
-        match = self.regex.search(source_string)
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
+        match = _APPLETV_URL_SEARCH(source_string)
         if match:
             content_id = match.group(1)
-            return {
-                "title": f"Apple TV+ {content_id}",
-                "type": "movie",
-                "source": self.source,
-                "provider_id": content_id,
-                "has_real_id": True
-            }
+            return cls._build_id_result(f"Apple TV+ {content_id}", "movie", content_id)
         
-        title = clean_window_title(source_string, [" - Apple TV+", " | Apple TV+", "Apple TV+ -"])
-        if not title:
-            return None
-
-        if title in ["Apple TV+", "Apple TV"]:
-            title = "Apple TV+ Übersicht"
-            
-        return {
-            "title": title,
-            "type": "movie",
-            "source": self.source,
-            "provider_id": title,
-            "description": "Automatisch erkannt (Browser)",
-            "has_real_id": False
-        }
+        return cls._build_fallback_result(
+            source_string,
+            default_type="movie"
+        )
 
 # ============================================================
 # 7. Twitch (NEU - Bonus)
 # ============================================================
+_TWITCH_URL_RE = re.compile(r"twitch\.tv/([a-zA-Z0-9_]+)", re.ASCII)
+_TWITCH_URL_SEARCH = _TWITCH_URL_RE.search
+
 class TwitchProvider(BaseProvider):
     """
     Twitch Media Provider.
@@ -421,37 +509,19 @@ class TwitchProvider(BaseProvider):
     """
     name = "Twitch"
     source = "twitch"
-    regex = re.compile(r"twitch\.tv/([a-zA-Z0-9_]+)")
+    regex = _TWITCH_URL_RE
+    keywords = ("Twitch",)
+    clean_phrases = (" - Twitch",)
 
-    def matches(self, source_string: str) -> bool:
-        return bool(self.regex.search(source_string)) or "Twitch" in source_string
-
-    def extract_info(self, source_string: str) -> dict:
-        match = self.regex.search(source_string)
+    @classmethod
+    def extract_info(cls, source_string: str) -> dict:
+        match = _TWITCH_URL_SEARCH(source_string)
         if match:
             channel = match.group(1)
             if channel.lower() not in ["directory", "settings", "videos"]:
-                return {
-                    "title": f"Twitch: {channel}",
-                    "type": "clip",
-                    "source": self.source,
-                    "provider_id": channel,
-                    "channel": channel,
-                    "has_real_id": True
-                }
+                return cls._build_id_result(f"Twitch: {channel}", "clip", channel, channel=channel)
         
-        title = clean_window_title(source_string, [" - Twitch"])
-        if not title:
-            return None
-            
-        return {
-            "title": title,
-            "type": "clip",
-            "source": self.source,
-            "provider_id": title,
-            "description": "Automatisch erkannt (Browser)",
-            "has_real_id": False
-        }
+        return cls._build_fallback_result(source_string, default_type="clip")
 
 # ============================================================
 # 8. LocalProvider
@@ -483,70 +553,266 @@ class LocalProvider(BaseProvider):
         # Podcast/Hörbuch
         ".m4b": "audiobook"
     }
+    # Endungen ohne Punkt für die Schnellprüfung per rpartition (ohne Path)
+    _SUFFIX_SET = frozenset(ext[1:] for ext in SUPPORTED)
 
-    def matches(self, s):
+    @classmethod
+    def matches(cls, s):
+        # Nur unterstützte Endungen kommen bis zum Dateisystem
+        if s.rpartition(".")[2].lower() not in cls._SUFFIX_SET:
+            return False
+        # Offensichtliche Nicht-Pfade (URLs, mehrzeilige Titel) ohne Syscall verwerfen
+        if "://" in s or "\n" in s or len(s) > 4096:
+            return False
         try:
-            return Path(s).exists() and Path(s).is_file()
+            # Ein stat() statt exists() + is_file()
+            return stat.S_ISREG(os.stat(s).st_mode)
         except (OSError, ValueError):
             return False
 
-    def extract_info(self, s):
+    @classmethod
+    def extract_info(cls, s):
         path = Path(s)
-        t = self.SUPPORTED.get(path.suffix.lower(), "file")
+        t = cls.SUPPORTED.get(path.suffix.lower(), "file")
+        resolved = str(path.resolve())
         return {
             "title": path.stem,
             "type": t,
             "source": "local",
-            "provider_id": str(path.resolve()),
+            "provider_id": resolved,
             "is_local_file": True,
-            "local_path": str(path.resolve()),
+            "local_path": resolved,
             "has_real_id": True
         }
 
 # ============================================================
 # Registry - Erweitert
 # ============================================================
+def _url_group(provider) -> str:
+    """URL-Muster eines Providers als benannte Gruppe (Name = source)."""
+    return f"(?P<{provider.source}>{provider.regex.pattern})"
+
+
+def _compile_url_regex(pattern: str):
+    """Kompiliert die kombinierte URL-Regex mit RE2, falls verfügbar, sonst mit re."""
+    if HAS_RE2:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass  # Muster von RE2 nicht unterstützt -> re
+    return re.compile(pattern, re.ASCII)
+
+
+def _keyword_group(provider) -> str:
+    """Alle Schlüsselwörter eines Providers als benannte Gruppe (Name = source)."""
+    parts = [re.escape(k) for k in provider.keywords]
+    parts += [f"(?i:{re.escape(k)})" for k in provider.keywords_ci]
+    return f"(?P<{provider.source}>{'|'.join(parts)})"
+
+
+def _build_keyword_automata(providers):
+    """
+    Baut Aho-Corasick-Automaten für alle Schlüsselwörter (nur mit pyahocorasick).
+
+    Returns:
+        (automat, automat_ci) - Werte sind (source, is_exclude) bzw. source;
+        (None, None) wenn pyahocorasick fehlt.
+    """
+    if not HAS_AHOCORASICK:
+        return None, None
+    automaton = ahocorasick.Automaton()
+    automaton_ci = ahocorasick.Automaton()
+    automaton.add_word(SELF_MARKER, (SELF_MARKER, False))
+    for p in providers:
+        for k in p.keywords:
+            automaton.add_word(k, (p.source, False))
+        for k in p.keyword_excludes:
+            automaton.add_word(k, (p.source, True))
+        for k in p.keywords_ci:
+            automaton_ci.add_word(k.lower(), p.source)
+    automaton.make_automaton()
+    if len(automaton_ci):
+        automaton_ci.make_automaton()
+    else:
+        automaton_ci = None
+    return automaton, automaton_ci
+
+
+_URL_PREFIXES = ("http://", "https://", "www.")
+_PATH_PREFIXES = ("/", "\\", "~", ".")
+
+
+def classify_source(source_string: str) -> str:
+    """
+    Ordnet den source_string grob ein: "url", "path" oder "title".
+
+    Pfade: absolut/relativ (/, \\, ~, .) oder mit Laufwerksbuchstabe (C:\\).
+    """
+    if source_string.startswith(_URL_PREFIXES):
+        return "url"
+    if source_string.startswith(_PATH_PREFIXES) or source_string[1:3] in (":\\", ":/"):
+        return "path"
+    return "title"
+
+
 class ProviderRegistry:
     """
     Zentrale Registry aller Media-Provider.
 
-    Verwendet Chain-of-Responsibility Pattern:
-    Jeder Provider wird nacheinander geprüft bis ein Match gefunden wird.
-
-    Reihenfolge ist wichtig: Spezifischere Provider (Netflix, Disney+)
-    vor generischeren (Local).
+    Statt jeden Provider einzeln zu fragen, laufen zwei kombinierte Regexes:
+    1. Alle URL-Muster in einer Alternation -> Gruppenname = Provider
+    2. Alle Titel-Schlüsselwörter in einer Alternation -> Menge der Treffer
+    Provider ohne Muster (Local) werden nur für Dateipfade gefragt - und
+    dann zuerst (siehe classify_source).
+    Ist pyahocorasick installiert, übernimmt ein Aho-Corasick-Automat die
+    Schlüsselwort-Suche (ein Durchlauf über den Titel, komplett in C); mit
+    google-re2 läuft die URL-Alternation über RE2 statt re.
+
+    Reihenfolge ist wichtig: Bei mehreren Keyword-Treffern gewinnt der
+    Provider, der in der Liste weiter vorne steht.
+
+    URL- und Titel-Erkennung werden pro source_string gecacht (LRU), da der
+    Poller denselben Fenstertitel oft minutenlang wiederholt; lokale
+    Dateien werden immer neu geprüft.
+
+    Für den Dispatch liegen die Provider zusätzlich als flache Tabelle
+    (source, name, extract_info) vor - gebundene Methoden statt Attribut-
+    Lookups auf den Provider-Klassen in jeder Iteration.
     """
+    # Sortiert nach erwarteter Trefferhäufigkeit; Local (Dateisystem) immer zuletzt
     providers = [
-        NetflixProvider(),
-        DisneyPlusProvider(),      # NEU
-        AmazonPrimeProvider(),     # NEU
-        AppleTVProvider(),         # NEU
-        YouTubeProvider(),
-        TwitchProvider(),          # NEU
-        SpotifyProvider(),
-        LocalProvider()
+        YouTubeProvider,
+        SpotifyProvider,
+        NetflixProvider,
+        TwitchProvider,            # NEU
+        DisneyPlusProvider,        # NEU
+        AmazonPrimeProvider,       # NEU
+        AppleTVProvider,           # NEU
+        LocalProvider
     ]
 
+    _by_source = {p.source: p for p in providers}
+    _table = tuple((p.source, p.name, p.extract_info) for p in providers)
+    _index = {p.source: i for i, p in enumerate(providers)}
+    _url_regex = _compile_url_regex(
+        "|".join(_url_group(p) for p in providers if p.regex is not None)
+    )
+    _keyword_regex = re.compile("|".join(
+        _keyword_group(p) for p in providers if p.keywords or p.keywords_ci
+    ))
+    _keyword_automaton, _keyword_automaton_ci = _build_keyword_automata(providers)
+    _excluding_providers = [p for p in providers if p.keyword_excludes]
+    # Provider ohne URL-Muster und Schlüsselwörter (z.B. Local): (matches, name, extract_info)
+    _path_providers = tuple(
+        (p.matches, p.name, p.extract_info)
+        for p in providers if p.regex is None and not (p.keywords or p.keywords_ci)
+    )
+
     @classmethod
     def identify(cls, source_string: str) -> dict | None:
-        """Identifiziert Medienquelle aus URL oder Fenstertitel."""
-        for p in cls.providers:
-            if p.matches(source_string):
-                result = p.extract_info(source_string)
-                if result:
-                    print(f"[Registry] Treffer! Provider: {p.name} -> {source_string[:40]}...")
-                    return result
+        """Identifiziert Medienquelle aus URL, Fenstertitel oder Dateipfad."""
+        # Dateipfade: zuerst lokale Dateien (nicht gecacht, Dateien können sich ändern)
+        if classify_source(source_string) == "path":
+            for matches, name, extract in cls._path_providers:
+                if matches(source_string):
+                    result = cls._try(name, extract, source_string)
+                    if result:
+                        return result
+
+        # URLs und Titel (und Pfade ohne lokale Datei): gecachte Erkennung
+        info = cls._identify_known(source_string)
+        if info is not None:
+            # Frisches Dict: Aufrufer verändern es (z.B. info["origin"])
+            return info.to_dict()
+        return None
+
+    @classmethod
+    def identify_many(cls, source_strings) -> list:
+        """
+        Identifiziert mehrere Quellen in einem Aufruf (z.B. alle offenen Tabs).
+
+        Doppelte Strings werden nur einmal erkannt; jede Position erhält
+        trotzdem ein eigenes Dict.
+
+        Returns:
+            Liste mit Dict oder None pro Eingabe (gleiche Reihenfolge)
+        """
+        source_strings = list(source_strings)
+        identify = cls.identify
+        found = {s: identify(s) for s in dict.fromkeys(source_strings)}
+        results = []
+        seen = set()
+        for s in source_strings:
+            result = found[s]
+            if result is not None and s in seen:
+                result = dict(result)
+            seen.add(s)
+            results.append(result)
+        return results
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _identify_known(cls, source_string: str) -> MediaInfo | None:
+        """URL- und Schlüsselwort-Erkennung (gecacht als MediaInfo)."""
+        # 1. URL: ein Regex-Durchlauf für alle Provider
+        match = cls._url_regex.search(source_string)
+        if match:
+            _, name, extract = cls._table[cls._index[match.lastgroup]]
+            result = cls._try(name, extract, source_string)
+            if result:
+                return MediaInfo(**result)
+
+        # 2. Titel-Schlüsselwörter: alle Treffer in einem Durchlauf
+        hits = cls._keyword_hits(source_string)
+        if hits:
+            try_ = cls._try
+            for src, name, extract in cls._table:
+                if src in hits:
+                    result = try_(name, extract, source_string)
+                    if result:
+                        return MediaInfo(**result)
         return None
+
+    @classmethod
+    def clear_cache(cls):
+        """Leert den Erkennungs-Cache (z.B. nach Änderungen an den Providern)."""
+        cls._identify_known.cache_clear()
+
+    @classmethod
+    def _keyword_hits(cls, source_string: str) -> set:
+        """Gibt die sources aller Provider zurück, deren Schlüsselwörter im Titel vorkommen."""
+        if cls._keyword_automaton is not None:
+            hits, excluded = set(), set()
+            for _, (src, is_exclude) in cls._keyword_automaton.iter(source_string):
+                (excluded if is_exclude else hits).add(src)
+            if SELF_MARKER in hits:
+                return set()
+            if cls._keyword_automaton_ci is not None:
+                hits.update(src for _, src in cls._keyword_automaton_ci.iter(source_string.lower()))
+            return hits - excluded
+
+        # Fallback ohne pyahocorasick: kombinierte Regex
+        if SELF_MARKER in source_string:
+            return set()
+        hits = {m.lastgroup for m in cls._keyword_regex.finditer(source_string)}
+        for p in cls._excluding_providers:
+            if p.source in hits and any(x in source_string for x in p.keyword_excludes):
+                hits.discard(p.source)
+        return hits
+
+    @staticmethod
+    def _try(name: str, extract, source_string: str) -> dict | None:
+        result = extract(source_string)
+        if result:
+            log.debug("[Registry] Treffer! Provider: %s -> %.40s...", name, source_string)
+        return result
     
     @classmethod
     def get_provider_names(cls) -> list:
         """Gibt Liste aller Provider-Namen zurück."""
-        return [p.name for p in cls.providers]
+        return [name for _, name, _ in cls._table]
     
     @classmethod
     def get_provider_by_source(cls, source: str):
         """Findet Provider anhand source-ID."""
-        for p in cls.providers:
-            if p.source == source:
-                return p
-        return None
+        return cls._by_source.get(source)
@@ -18,9 +18,25 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QDate, QStringListModel
 from PyQt6.QtGui import QIcon
 
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+import hashlib
 import json
+import logging
+import os
+import re
 from pathlib import Path
+from typing import NamedTuple
+
+# Optional: schnellerer JSON-Serializer für Suchprofile
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+log = logging.getLogger("MediaBrain.search")
 
 # ============================================================
 # 1. Filter-Definitionen
@@ -58,6 +74,10 @@ SORT_OPTIONS = [
     ("Bewertung", "rating", True)
 ]
 
+# Erlaubte Sortierfelder (landen direkt im SQL-Text, daher Whitelist)
+# "rating" ist (noch) keine Spalte von media_items -> Sortierung fällt auf last_opened_at zurück
+_SORT_FIELDS = frozenset(sort_field for _, sort_field, _ in SORT_OPTIONS) - {"rating"}
+
 TIME_FILTERS = [
     ("Alle Zeiten", None),
     ("Heute", 1),
@@ -67,24 +87,110 @@ TIME_FILTERS = [
     ("Dieses Jahr", 365)
 ]
 
+# CJK-Schrift: unicode61 trennt hier keine Wörter -> Textsuche per LIKE
+_CJK_RE = re.compile("[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+# Buchstabe oder Ziffer: nur solche Zeichen ergeben unicode61-Tokens
+_WORD_CHAR_RE = re.compile(r"[^\W_]")
+
+
+def build_fts_query(text):
+    """
+    Baut aus einer Benutzereingabe eine FTS5-MATCH-Query.
+
+    Jedes Wort wird gequotet (FTS-Operatoren wie AND, NEAR, * verlieren ihre
+    Bedeutung) und als Präfix gesucht; alle Wörter müssen vorkommen.
+
+    Reine Satzzeichen ergeben keine Tokens und würden nichts finden; sie
+    werden übergangen, ohne Wort-Tokens fällt die Suche auf LIKE zurück.
+
+    Returns:
+        MATCH-String oder None, wenn die Eingabe nicht per FTS gesucht werden kann
+    """
+    if _CJK_RE.search(text):
+        return None
+    tokens = [t.replace('"', '""') for t in text.split() if _WORD_CHAR_RE.search(t)]
+    if not tokens:
+        return None
+    return " ".join(f'"{t}"*' for t in tokens)
+
+
+# NOCASE faltet nur ASCII - die Bereichsgrenzen müssen genauso gefaltet sein
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def prefix_range(prefix):
+    """
+    Wandelt ein Präfix in die Grenzen einer Bereichsabfrage (lower <= x < upper).
+
+    Statt LIKE 'präfix%' kann SQLite so den Index auf title COLLATE NOCASE nutzen.
+    Die Obergrenze ist das Präfix mit um eins erhöhtem letzten Zeichen. Dabei
+    werden A-Z (unter NOCASE gleich a-z) und Surrogate übersprungen; endet das
+    Präfix auf dem höchsten Codepoint, wird das Zeichen davor erhöht.
+
+    Returns:
+        (lower, upper); upper ist None, wenn es keine Obergrenze gibt
+        (leeres Präfix oder nur höchste Codepoints)
+    """
+    lower = prefix.translate(_ASCII_LOWER)
+    head = lower.rstrip("\U0010ffff")
+    if not head:
+        return lower, None
+    nxt = ord(head[-1]) + 1
+    if 0x41 <= nxt <= 0x5A:
+        nxt = 0x5B
+    elif 0xD800 <= nxt <= 0xDFFF:
+        nxt = 0xE000
+    return lower, head[:-1] + chr(nxt)
+
+
+def _keyset_clause(sort_field, desc, value, item_id):
+    """
+    WHERE-Bedingung für alle Zeilen nach dem Cursor (value, item_id).
+
+    Sortierung: sort_field ASC/DESC, dann id ASC. NULL-Werte liegen in SQLite
+    vorne (ASC) bzw. hinten (DESC) und werden gesondert behandelt.
+
+    Returns:
+        (sql, params) mit benannten Parametern :cursor_value / :cursor_id
+    """
+    if value is None:
+        sql = f"({sort_field} IS NULL AND id > :cursor_id)"
+        if not desc:
+            sql = f"({sql} OR {sort_field} IS NOT NULL)"
+        return sql, {"cursor_id": item_id}
+    op = "<" if desc else ">"
+    sql = f"{sort_field} {op} :cursor_value OR ({sort_field} = :cursor_value AND id > :cursor_id)"
+    if desc:
+        sql += f" OR {sort_field} IS NULL"
+    return f"({sql})", {"cursor_value": value, "cursor_id": item_id}
+
 # ============================================================
 # 2. SearchCriteria Datenklasse
 # ============================================================
 
+@dataclass(slots=True, eq=False)
 class SearchCriteria:
     """Hält alle Suchkriterien."""
     
-    def __init__(self):
-        self.text = ""
-        self.media_type = None
-        self.provider = None
-        self.favorites_only = False
-        self.exclude_blacklist = True
-        self.time_filter_days = None
-        self.sort_field = "last_opened_at"
-        self.sort_desc = True
-        self.tags = []
-        self.min_rating = None
+    text: str = ""
+    media_type: str | None = None
+    provider: str | None = None
+    favorites_only: bool = False
+    exclude_blacklist: bool = True
+    time_filter_days: int | None = None
+    sort_field: str = "last_opened_at"
+    sort_desc: bool = True
+    tags: list = field(default_factory=list)
+    min_rating: float | None = None
+    # Seitenweise Abfrage (Keyset): Sortwert + id des letzten Items der Vorseite
+    page_size: int = 500
+    cursor_value: object = None
+    cursor_id: int | None = None
+
+    @property
+    def like_pattern(self):
+        """LIKE-Muster für die Textsuche (None ohne Suchtext)."""
+        return f"%{self.text}%" if self.text else None
         
     def to_dict(self):
         return {
@@ -99,6 +205,36 @@ class SearchCriteria:
             "tags": self.tags,
             "min_rating": self.min_rating
         }
+
+    def cache_key(self):
+        """Unveränderlicher Schnappschuss aller Kriterien (Schlüssel für Such-Caches)."""
+        return (
+            self.text, self.media_type, self.provider, self.favorites_only,
+            self.exclude_blacklist, self.time_filter_days, self.sort_field,
+            self.sort_desc, tuple(self.tags), self.min_rating,
+            self.page_size, self.cursor_value, self.cursor_id
+        )
+
+    def next_page(self, last_item):
+        """
+        Kriterien für die Folgeseite nach last_item (letztes Item der aktuellen Seite).
+
+        Gespeichert werden nur die Filter (to_dict), der Cursor ist flüchtig.
+        """
+        c = SearchCriteria.from_dict(self.to_dict())
+        c.page_size = self.page_size
+        c.cursor_value = getattr(last_item, self.resolved_sort_field())
+        c.cursor_id = last_item.id
+        return c
+
+    def resolved_sort_field(self):
+        """Tatsächlich verwendete Sortierspalte (unbekannte Felder -> last_opened_at)."""
+        return self.sort_field if self.sort_field in _SORT_FIELDS else "last_opened_at"
+
+    def __eq__(self, other):
+        if not isinstance(other, SearchCriteria):
+            return NotImplemented
+        return self.cache_key() == other.cache_key()
     
     @classmethod
     def from_dict(cls, data):
@@ -210,8 +346,8 @@ class AdvancedSearchBar(QWidget):
         sort_group = QGroupBox("Sortierung")
         sort_layout = QVBoxLayout(sort_group)
         self.combo_sort = QComboBox()
-        for label, field, desc in SORT_OPTIONS:
-            self.combo_sort.addItem(label, (field, desc))
+        for label, sort_field, desc in SORT_OPTIONS:
+            self.combo_sort.addItem(label, (sort_field, desc))
         self.combo_sort.currentIndexChanged.connect(self._on_sort_changed)
         sort_layout.addWidget(self.combo_sort)
         filter_layout.addWidget(sort_group)
@@ -320,77 +456,161 @@ class AdvancedSearchBar(QWidget):
 # 4. SearchEngine
 # ============================================================
 
+class ProjectedItem(NamedTuple):
+    """Schlanker Treffer (nur id + Titel) für Listen und Autocomplete."""
+    id: int
+    title: str
+
+
 class SearchEngine:
     """
     Führt erweiterte Suchen auf der Datenbank aus.
+
+    Ergebnisse werden pro Kriterien-Satz in einem kleinen LRU-Cache gehalten
+    und bei jedem Schreibzugriff auf die Datenbank verworfen. Suchen mit
+    relativem Zeitfilter werden nicht gecacht.
     """
     
+    CACHE_SIZE = 64
+    
     def __init__(self, db):
         self.db = db
+        self._cache = OrderedDict()
+        db.add_write_listener(self._cache.clear)
         
     def search(self, criteria: SearchCriteria):
         """Führt Suche basierend auf Kriterien aus."""
+        return self._cached(criteria.cache_key(), self._search, criteria)
+
+    def search_ids_titles(self, criteria: SearchCriteria):
+        """
+        Wie search(), liefert aber nur ProjectedItem(id, title) statt MediaItems.
+
+        Für Ansichten, die nur Titel anzeigen; das volle MediaItem wird erst
+        bei Bedarf (z.B. per get_by_provider/id) geladen.
+        """
+        return self._cached(("ids_titles",) + criteria.cache_key(), self._search_ids_titles, criteria)
+
+    def _cached(self, key, loader, criteria):
+        """LRU-Zugriff auf den Ergebnis-Cache; liefert immer eine eigene Liste."""
+        # Relative Zeitfenster ("letzte 7 Tage") wandern mit der Uhr -> nicht cachen
+        if criteria.time_filter_days:
+            return loader(criteria)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return list(cached)
+        
+        results = loader(criteria)
+        self._cache[key] = results
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return list(results)
+        
+    def _search(self, criteria: SearchCriteria):
+        """Führt die Suche auf der Datenbank aus (ohne Cache)."""
+        tail, params = self._build_where_and_params(criteria)
+        rows = self.db.fetchall("SELECT * FROM media_items" + tail, params)
+        
+        # In MediaItem-Objekte umwandeln
+        from core import MediaItem
+        return list(map(MediaItem, rows))
+
+    def _search_ids_titles(self, criteria: SearchCriteria):
+        """Wie _search, aber nur id + title (ohne MediaItem-Aufbau)."""
+        tail, params = self._build_where_and_params(criteria)
+        rows = self.db.fetchall("SELECT id, title FROM media_items" + tail, params)
+        return list(map(ProjectedItem._make, rows))
+
+    def _build_where_and_params(self, criteria: SearchCriteria):
+        """
+        Baut WHERE, ORDER BY und LIMIT einer Suche (alles nach "FROM media_items").
+
+        Returns:
+            (sql, params) mit benannten Parametern
+        """
+        # Bedingungen von billig (Integer-Flags, Gleichheit) nach teuer (Text);
+        # benannte Parameter, damit mehrfach genutzte Werte nur einmal gebunden werden
+        clauses = []
+        params = {}
         
-        # Basis-Query
-        query = "SELECT * FROM media_items WHERE 1=1"
-        params = []
+        # Favoriten
+        if criteria.favorites_only:
+            clauses.append("is_favorite = 1")
         
-        # Textsuche
-        if criteria.text:
-            query += " AND (title LIKE ? OR description LIKE ?)"
-            search_term = f"%{criteria.text}%"
-            params.extend([search_term, search_term])
+        # Blacklist
+        if criteria.exclude_blacklist:
+            clauses.append("blacklist_flag = 0")
         
         # Typ-Filter
         if criteria.media_type:
-            query += " AND type = ?"
-            params.append(criteria.media_type)
+            clauses.append("type = :media_type")
+            params["media_type"] = criteria.media_type
         
         # Provider-Filter
         if criteria.provider:
-            query += " AND source = ?"
-            params.append(criteria.provider)
-        
-        # Favoriten
-        if criteria.favorites_only:
-            query += " AND is_favorite = 1"
-        
-        # Blacklist
-        if criteria.exclude_blacklist:
-            query += " AND blacklist_flag = 0"
+            clauses.append("source = :provider")
+            params["provider"] = criteria.provider
         
         # Zeitraum
         if criteria.time_filter_days:
             cutoff = (datetime.now() - timedelta(days=criteria.time_filter_days)).isoformat()
-            query += " AND last_opened_at >= ?"
-            params.append(cutoff)
-        
-        # Sortierung
+            clauses.append("last_opened_at >= :cutoff")
+            params["cutoff"] = cutoff
+        
+        # Folgeseite: nur Einträge hinter dem Cursor (Keyset statt OFFSET)
+        sort_field = criteria.resolved_sort_field()
+        if criteria.cursor_id is not None:
+            clause, cursor_params = _keyset_clause(
+                sort_field, criteria.sort_desc, criteria.cursor_value, criteria.cursor_id
+            )
+            clauses.append(clause)
+            params.update(cursor_params)
+        
+        # Textsuche (zuletzt): FTS5-Index (Präfixsuche), sonst LIKE-Scan
+        if criteria.text:
+            fts_query = build_fts_query(criteria.text) if self.db.has_fts else None
+            if fts_query:
+                clauses.append("id IN (SELECT rowid FROM media_items_fts WHERE media_items_fts MATCH :q)")
+                params["q"] = fts_query
+            else:
+                clauses.append("(title LIKE :q OR description LIKE :q)")
+                params["q"] = criteria.like_pattern
+        
+        query = ""
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        
+        # Sortierung (nur bekannte Felder -> begrenzte Zahl an Query-Formen);
+        # id als eindeutiger Tiebreaker, aufsteigend wie im Index
         order_dir = "DESC" if criteria.sort_desc else "ASC"
-        query += f" ORDER BY {criteria.sort_field} {order_dir}"
-        
-        # Limit
-        query += " LIMIT 500"
-        
-        # Ausführen
-        rows = self.db.fetchall(query, params)
+        query += f" ORDER BY {sort_field} {order_dir}, id ASC"
         
-        # In MediaItem-Objekte umwandeln
-        from core import MediaItem
-        return [MediaItem(row) for row in rows]
+        # Limit (Seitengröße)
+        query += " LIMIT :limit"
+        params["limit"] = criteria.page_size
+        return query, params
     
     def get_suggestions(self, text, limit=10):
-        """Holt Vorschläge für Autocomplete."""
+        """Holt Vorschläge für Autocomplete (Titel, die mit text beginnen)."""
         if not text or len(text) < 2:
             return []
         
-        query = """
+        # Bereich statt LIKE '%text%' -> Index-Seek auf idx_media_title_nocase
+        # ("+blacklist_flag" verhindert, dass der Planer den Blacklist-Index wählt)
+        lower, upper = prefix_range(text)
+        if upper is None:
+            upper_clause, params = "", (lower, limit)
+        else:
+            upper_clause, params = "AND title < ? COLLATE NOCASE", (lower, upper, limit)
+        query = f"""
             SELECT DISTINCT title FROM media_items 
-            WHERE title LIKE ? AND blacklist_flag = 0
+            WHERE title >= ? COLLATE NOCASE {upper_clause}
+              AND +blacklist_flag = 0
             ORDER BY last_opened_at DESC
             LIMIT ?
         """
-        rows = self.db.fetchall(query, (f"%{text}%", limit))
+        rows = self.db.fetchall(query, params)
         return [row["title"] for row in rows]
     
     def get_all_tags(self):
@@ -408,23 +628,72 @@ class SearchProfileManager:
     def __init__(self, config_path=None):
         self.config_path = config_path or Path.home() / ".mediabrain" / "search_profiles.json"
         self.profiles = {}
+        # Hash des zuletzt gelesenen/geschriebenen Dateiinhalts
+        self._last_written_hash = b""
         self._load()
         
     def _load(self):
-        if self.config_path.exists():
+        if not self.config_path.exists():
+            return
+        try:
+            with open(self.config_path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            log.warning("Suchprofile nicht lesbar (%s): %s", self.config_path, e)
+            return
+
+        try:
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("Profildatei enthält kein JSON-Objekt")
+            profiles = {name: SearchCriteria.from_dict(criteria_dict)
+                        for name, criteria_dict in data.items()}
+        except (ValueError, TypeError, AttributeError) as e:
+            # Kaputte Datei einmalig beiseite legen, danach greift der "keine Datei"-Pfad
+            corrupt_path = self._corrupt_backup_path()
+            log.warning("Suchprofile korrupt, verschoben nach %s: %s", corrupt_path.name, e)
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for name, criteria_dict in data.items():
-                        self.profiles[name] = SearchCriteria.from_dict(criteria_dict)
-            except:
-                pass
+                os.replace(self.config_path, corrupt_path)
+            except OSError as e:
+                log.warning("Korrupte Suchprofile nicht verschiebbar: %s", e)
+            return
+
+        self.profiles = profiles
+        self._last_written_hash = self._digest(raw)
+
+    def _corrupt_backup_path(self):
+        """Freier Name für eine korrupte Profildatei (Zeitstempel, bei Kollision Zähler)."""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        base = f"{self.config_path.name}.corrupt-{stamp}"
+        candidate = self.config_path.with_name(base)
+        counter = 1
+        while candidate.exists():
+            candidate = self.config_path.with_name(f"{base}-{counter}")
+            counter += 1
+        return candidate
+
+    @staticmethod
+    def _digest(payload):
+        return hashlib.blake2b(payload, digest_size=16).digest()
                 
     def _save(self):
+        """Schreibt alle Profile atomar (Temp-Datei + os.replace)."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            data = {name: criteria.to_dict() for name, criteria in self.profiles.items()}
-            json.dump(data, f, indent=2)
+        data = {name: criteria.to_dict() for name, criteria in self.profiles.items()}
+        if HAS_ORJSON:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        # Unveränderte Profile nicht erneut schreiben (außer die Datei fehlt inzwischen)
+        digest = self._digest(payload)
+        if digest == self._last_written_hash and self.config_path.exists():
+            return
+        # Ein Absturz beim Schreiben trifft nur die Temp-Datei, nie die Profile
+        tmp_path = self.config_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.config_path)
+        self._last_written_hash = digest
             
     def save_profile(self, name, criteria):
         self.profiles[name] = criteria
@@ -447,6 +716,14 @@ class SearchProfileManager:
 
 class SaveSearchDialog(QDialog):
     """Dialog zum Speichern einer Suche als Profil."""
+
+    # (Attribut, Format) der Filter, die in der Zusammenfassung erscheinen
+    _SUMMARY_FIELDS = (
+        ("text", 'Text: "{}"'),
+        ("media_type", "Typ: {}"),
+        ("provider", "Provider: {}"),
+        ("favorites_only", "Nur Favoriten"),
+    )
     
     def __init__(self, criteria, parent=None):
         super().__init__(parent)
@@ -476,16 +753,10 @@ class SaveSearchDialog(QDialog):
         layout.addRow(buttons)
         
     def _build_summary(self):
-        parts = []
-        if self.criteria.text:
-            parts.append(f'Text: "{self.criteria.text}"')
-        if self.criteria.media_type:
-            parts.append(f"Typ: {self.criteria.media_type}")
-        if self.criteria.provider:
-            parts.append(f"Provider: {self.criteria.provider}")
-        if self.criteria.favorites_only:
-            parts.append("Nur Favoriten")
-        return ", ".join(parts) if parts else "Keine Filter"
+        criteria = self.criteria
+        parts = [fmt.format(value) for attr, fmt in self._SUMMARY_FIELDS
+                 if (value := getattr(criteria, attr))]
+        return ", ".join(parts) or "Keine Filter"
         
     def get_name(self):
         return self.name_input.text().strip()
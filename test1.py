@@ -1,4 +1,5 @@
 import sqlite3
+import sys
 from pathlib import Path
 
 # Pfad zur DB (muss im selben Ordner liegen wie deine Skripte)
@@ -13,13 +14,21 @@ else:
     print(f"--- Inhalt der Datenbank ({db_path}) ---")
     try:
         cursor.execute("SELECT id, title, source, type FROM media_items")
-        rows = cursor.fetchall()
-        
-        if not rows:
+        empty = True
+
+        # In Blöcken lesen und pro Block nur einmal schreiben
+        while True:
+            chunk = cursor.fetchmany(1000)
+            if not chunk:
+                break
+            empty = False
+            sys.stdout.write("\n".join(
+                f"ID: {row[0]} | Titel: {row[1]} | Quelle: {row[2]} | Typ: {row[3]}" for row in chunk
+            ))
+            sys.stdout.write("\n")
+
+        if empty:
             print("⚠️ Die Tabelle ist LEER.")
-        else:
-            for row in rows:
-                print(f"ID: {row[0]} | Titel: {row[1]} | Quelle: {row[2]} | Typ: {row[3]}")
                 
     except Exception as e:
         print(f"Fehler beim Lesen: {e}")
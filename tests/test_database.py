@@ -16,8 +16,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import unittest
-import tempfile
-import os
+import sqlite3
 from datetime import datetime, timedelta
 from core import Database, MediaManager, MediaItem, BlacklistManager
 
@@ -26,15 +25,12 @@ class TestDatabase(unittest.TestCase):
     """Integration Tests für Database-Klasse"""
 
     def setUp(self):
-        """Erstellt temporäre Test-Datenbank für jeden Test"""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
+        """Erstellt eine frische In-Memory-Datenbank für jeden Test"""
+        self.db = Database(":memory:")
 
     def tearDown(self):
-        """Räumt temporäre Datenbank auf"""
+        """Schließt die Datenbank (In-Memory-Inhalt wird verworfen)"""
         self.db.conn.close()
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
 
     def test_database_initialization(self):
         """Datenbank wird korrekt initialisiert"""
@@ -57,6 +53,23 @@ class TestDatabase(unittest.TestCase):
         self.assertIn("idx_media_favorite", indexes)
         self.assertIn("idx_media_blacklist", indexes)
         self.assertIn("idx_media_type_blacklist", indexes)  # Composite Index
+        self.assertIn("idx_media_title_nocase", indexes)    # Autocomplete
+
+    def test_connection_pragmas(self):
+        """Verbindungs-PRAGMAs für die Suche sind gesetzt"""
+        self.assertEqual(self.db.fetchone("PRAGMA cache_size")[0], -65536)
+        self.assertEqual(self.db.fetchone("PRAGMA temp_store")[0], 2)
+
+    def test_search_shape_uses_composite_index(self):
+        """Typ-Suche sortiert über den Composite-Index statt per Temp-B-Tree"""
+        plan = self.db.fetchall(
+            "EXPLAIN QUERY PLAN SELECT * FROM media_items "
+            "WHERE blacklist_flag = 0 AND type = ? ORDER BY last_opened_at DESC, id ASC LIMIT ?",
+            ("movie", 500)
+        )
+        details = " ".join(row["detail"] for row in plan)
+        self.assertIn("idx_media_bl_type_opened", details)
+        self.assertNotIn("TEMP B-TREE", details)
 
     def test_execute_query(self):
         """execute() führt INSERT aus"""
@@ -90,21 +103,78 @@ class TestDatabase(unittest.TestCase):
         rows = self.db.fetchall("SELECT * FROM media_items WHERE type = ?", ("movie",))
         self.assertEqual(len(rows), 5)
 
+    def test_transaction_commits_batch(self):
+        """transaction() schreibt executemany-Batch in einem Commit"""
+        rows = [(f"Batch {i}", "movie", "netflix", f"batch_{i}") for i in range(3)]
+        with self.db.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+                rows
+            )
+        self.assertFalse(self.db.conn.in_transaction)
+        self.assertEqual(len(self.db.fetchall("SELECT * FROM media_items")), 3)
+
+    def test_transaction_rolls_back_on_error(self):
+        """transaction() rollt bei Exception zurück"""
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.db.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+                    ("Rollback", "movie", "netflix", "rb1")
+                )
+                conn.execute(
+                    "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+                    (None, "movie", "netflix", "rb2")
+                )
+        self.assertEqual(len(self.db.fetchall("SELECT * FROM media_items")), 0)
+
+    def test_write_listener_notified(self):
+        """Write-Listener laufen nach Schreibzugriffen, nicht nach SELECTs"""
+        calls = []
+        self.db.add_write_listener(lambda: calls.append(1))
+        self.db.execute(
+            "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+            ("Listener", "movie", "netflix", "wl1")
+        )
+        self.db.execute("SELECT * FROM media_items")
+        self.db.fetchall("SELECT * FROM media_items")
+        self.assertEqual(len(calls), 1)
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE media_items SET is_favorite = 1")
+        self.assertEqual(len(calls), 2)
+
+    def test_fts_index_follows_changes(self):
+        """FTS5-Index wird per Trigger bei INSERT/UPDATE/DELETE nachgeführt"""
+        if not self.db.has_fts:
+            self.skipTest("SQLite ohne FTS5")
+        match = "SELECT rowid FROM media_items_fts WHERE media_items_fts MATCH ?"
+        cur = self.db.execute(
+            "INSERT INTO media_items (title, type, source, provider_id, description) VALUES (?, ?, ?, ?, ?)",
+            ("Stranger Things", "series", "netflix", "fts1", "Mystery in Hawkins")
+        )
+        item_id = cur.lastrowid
+        self.assertEqual([r[0] for r in self.db.fetchall(match, ('"strang"*',))], [item_id])
+        self.assertEqual(len(self.db.fetchall(match, ('"hawkins"',))), 1)
+
+        self.db.execute("UPDATE media_items SET title = ? WHERE id = ?", ("Dark", item_id))
+        self.assertEqual(len(self.db.fetchall(match, ('"stranger"',))), 0)
+        self.assertEqual(len(self.db.fetchall(match, ('"dark"',))), 1)
+
+        self.db.execute("DELETE FROM media_items WHERE id = ?", (item_id,))
+        self.assertEqual(len(self.db.fetchall(match, ('"dark"',))), 0)
+
 
 class TestMediaManager(unittest.TestCase):
     """Integration Tests für MediaManager"""
 
     def setUp(self):
-        """Erstellt temporäre Test-Datenbank für jeden Test"""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
+        """Erstellt eine frische In-Memory-Datenbank für jeden Test"""
+        self.db = Database(":memory:")
         self.manager = MediaManager(self.db)
 
     def tearDown(self):
-        """Räumt temporäre Datenbank auf"""
+        """Schließt die Datenbank (In-Memory-Inhalt wird verworfen)"""
         self.db.conn.close()
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
 
     def test_add_or_update_valid_data(self):
         """Valide Daten werden eingefügt"""
@@ -187,15 +257,11 @@ class TestMediaManager(unittest.TestCase):
     def test_list_by_type_filters_correctly(self):
         """list_by_type filtert nach Typ"""
         # Verschiedene Typen einfügen
-        self.manager.add_or_update({
-            "title": "Movie 1", "type": "movie", "source": "netflix", "provider_id": "m1"
-        })
-        self.manager.add_or_update({
-            "title": "Movie 2", "type": "movie", "source": "netflix", "provider_id": "m2"
-        })
-        self.manager.add_or_update({
-            "title": "Song 1", "type": "music", "source": "spotify", "provider_id": "s1"
-        })
+        self.manager.add_or_update_many([
+            {"title": "Movie 1", "type": "movie", "source": "netflix", "provider_id": "m1"},
+            {"title": "Movie 2", "type": "movie", "source": "netflix", "provider_id": "m2"},
+            {"title": "Song 1", "type": "music", "source": "spotify", "provider_id": "s1"},
+        ])
 
         movies = self.manager.list_by_type("movie")
         music = self.manager.list_by_type("music")
@@ -208,12 +274,10 @@ class TestMediaManager(unittest.TestCase):
     def test_list_by_type_excludes_blacklisted(self):
         """list_by_type filtert geblacklistete Items aus"""
         # Normal und blacklisted Items einfügen
-        self.manager.add_or_update({
-            "title": "Normal Movie", "type": "movie", "source": "netflix", "provider_id": "n1"
-        })
-        self.manager.add_or_update({
-            "title": "Blacklisted Movie", "type": "movie", "source": "netflix", "provider_id": "b1"
-        })
+        self.manager.add_or_update_many([
+            {"title": "Normal Movie", "type": "movie", "source": "netflix", "provider_id": "n1"},
+            {"title": "Blacklisted Movie", "type": "movie", "source": "netflix", "provider_id": "b1"},
+        ])
 
         # Zweites Item blacklisten
         self.db.execute(
@@ -225,22 +289,89 @@ class TestMediaManager(unittest.TestCase):
         self.assertEqual(len(movies), 1)
         self.assertEqual(movies[0].title, "Normal Movie")
 
+    def test_add_or_update_many_upserts(self):
+        """Batch aktualisiert bestehende Einträge, ohne Flags zu verlieren"""
+        self.manager.add_or_update_many([
+            {"title": "Fav", "type": "movie", "source": "netflix", "provider_id": "f1"},
+            {"title": "Blocked", "type": "movie", "source": "netflix", "provider_id": "b1"},
+        ])
+        self.db.execute("UPDATE media_items SET is_favorite = 1 WHERE provider_id = 'f1'")
+        self.db.execute("UPDATE media_items SET blacklist_flag = 1, last_opened_at = NULL WHERE provider_id = 'b1'")
+
+        self.manager.add_or_update_many([
+            {"title": "Fav", "type": "movie", "source": "netflix", "provider_id": "f1", "open_method": "browser"},
+            {"title": "Blocked", "type": "movie", "source": "netflix", "provider_id": "b1"},
+            {"title": "New", "type": "clip", "source": "youtube", "provider_id": "y1"},
+        ])
+
+        fav = self.manager.get_by_provider("f1", "netflix")
+        self.assertTrue(fav.is_favorite)
+        self.assertEqual(fav.open_method, "browser")
+        self.assertIsNone(self.manager.get_by_provider("b1", "netflix").last_opened_at)
+        self.assertIsNotNone(self.manager.get_by_provider("y1", "youtube"))
+        count = self.db.fetchone("SELECT COUNT(*) FROM media_items")[0]
+        self.assertEqual(count, 3)
+
+    def test_update_metadata_many(self):
+        """Batch-Update schreibt Metadaten und behält Felder ohne neuen Wert"""
+        self.manager.add_or_update_many([
+            {"title": "A", "type": "music", "source": "spotify", "provider_id": "a",
+             "description": "alt", "thumbnail_url": "old.jpg"},
+            {"title": "B", "type": "movie", "source": "netflix", "provider_id": "b"},
+        ])
+        a = self.manager.get_by_provider("a", "spotify")
+        b = self.manager.get_by_provider("b", "netflix")
+
+        self.manager.update_metadata_many([
+            ("neu", None, a.id),
+            (None, "cover.jpg", b.id),
+        ])
+
+        a = self.manager.get_by_provider("a", "spotify")
+        b = self.manager.get_by_provider("b", "netflix")
+        self.assertEqual((a.description, a.thumbnail_url), ("neu", "old.jpg"))
+        self.assertEqual((b.description, b.thumbnail_url), (None, "cover.jpg"))
+
+    def test_add_or_update_many_validates_whole_batch(self):
+        """Ein ungültiger Eintrag verhindert das Schreiben des ganzen Batches"""
+        with self.assertRaises(ValueError):
+            self.manager.add_or_update_many([
+                {"title": "Ok", "type": "movie", "source": "netflix", "provider_id": "ok"},
+                {"title": "Bad", "type": "invalid_type", "source": "netflix", "provider_id": "bad"},
+            ])
+        self.assertIsNone(self.manager.get_by_provider("ok", "netflix"))
+
+
+class TestMediaItem(unittest.TestCase):
+    """Tests für MediaItem"""
+
+    def test_constructor_converts_flags_with_slots(self):
+        """Row wird in Attribute übernommen, Flags werden zu bool"""
+        db = Database(":memory:")
+        db.execute(
+            "INSERT INTO media_items (title, type, source, provider_id, is_favorite) VALUES (?, ?, ?, ?, ?)",
+            ("Slots", "movie", "netflix", "s1", 1)
+        )
+        item = MediaItem(db.fetchone("SELECT * FROM media_items"))
+        db.conn.close()
+        self.assertEqual(item.title, "Slots")
+        self.assertIs(item.is_favorite, True)
+        self.assertIs(item.is_local_file, False)
+        self.assertFalse(hasattr(item, "__dict__"))
+
 
 class TestBlacklistManager(unittest.TestCase):
     """Integration Tests für BlacklistManager"""
 
     def setUp(self):
-        """Erstellt temporäre Test-Datenbank für jeden Test"""
-        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        self.db = Database(self.db_path)
+        """Erstellt eine frische In-Memory-Datenbank für jeden Test"""
+        self.db = Database(":memory:")
         self.media_manager = MediaManager(self.db)
         self.blacklist_manager = BlacklistManager(self.db)
 
     def tearDown(self):
-        """Räumt temporäre Datenbank auf"""
+        """Schließt die Datenbank (In-Memory-Inhalt wird verworfen)"""
         self.db.conn.close()
-        os.close(self.db_fd)
-        os.unlink(self.db_path)
 
     def test_set_blacklist_enables(self):
         """set_blacklist aktiviert Blacklist"""
@@ -0,0 +1,214 @@
+"""
+test_metadata.py
+Tests für MetadataFetcher und MetadataCache in metadata_v2
+
+Testet:
+- Request-Deduplizierung bei parallelen, identischen Abfragen
+- Negativ-Cache (Miss) innerhalb und nach Ablauf der TTL
+- Keine Miss-Einträge bei gescheiterten Anfragen
+- Cover-Art-Nachladung im Hintergrund und wait_for_cover
+
+Alle HTTP-Aufrufe laufen über ein gestubbtes requests.get, es werden
+keine echten APIs angefragt.
+"""
+
+import sys
+from pathlib import Path
+
+# Projekt-Root zum Path hinzufügen
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import threading
+import time
+import types
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+try:
+    import requests  # noqa: F401
+except ImportError:
+    # requests.get wird in jedem Test ersetzt -> ein leeres Modul genügt
+    sys.modules["requests"] = types.ModuleType("requests")
+
+import metadata_v2
+from metadata_v2 import MetadataCache, MetadataFetcher, TMDbFetcher
+
+
+class FakeResponse:
+    """Minimaler Ersatz für requests.Response"""
+
+    def __init__(self, status_code=200, data=None):
+        self.status_code = status_code
+        self._data = data or {}
+
+    def json(self):
+        return self._data
+
+
+class FakeApi:
+    """Beantwortet requests.get anhand von URL-Fragmenten und protokolliert die Aufrufe"""
+
+    def __init__(self, routes, delay=0):
+        self.routes = routes
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.calls.append(url)
+        if self.delay:
+            time.sleep(self.delay)
+        for fragment, answer in self.routes.items():
+            if fragment in url:
+                return answer() if callable(answer) else answer
+        return FakeResponse(404)
+
+    def count(self, fragment):
+        with self._lock:
+            return sum(1 for url in self.calls if fragment in url)
+
+
+class MetadataTestCase(unittest.TestCase):
+    """Basis: Fetcher mit In-Memory-Cache, TMDb-Key und ohne OMDb"""
+
+    def setUp(self):
+        with mock.patch.object(metadata_v2, "get_api_key", return_value=""):
+            self.fetcher = MetadataFetcher(cache_enabled=False)
+        self.fetcher.tmdb = TMDbFetcher(api_key="test-key")
+        self.fetcher.cache = MetadataCache(":memory:")
+
+    def tearDown(self):
+        self.fetcher.close()
+
+    def use_api(self, api):
+        patcher = mock.patch.object(metadata_v2.requests, "get", api.get, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return api
+
+
+class TestDeduplication(MetadataTestCase):
+    """Tests für die Request-Deduplizierung"""
+
+    def test_concurrent_identical_fetches_share_one_request(self):
+        """Parallele fetch_movie-Aufrufe mit gleichem Titel lösen genau eine Suche aus"""
+        api = self.use_api(FakeApi({
+            "/search/movie": FakeResponse(200, {"results": [{"id": 7, "title": "Matrix"}]}),
+            "/movie/7": FakeResponse(200, {"id": 7, "title": "Matrix", "release_date": "1999-03-31"}),
+        }, delay=0.1))
+
+        barrier = threading.Barrier(5)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(self.fetcher.fetch_movie("Matrix", 1999))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(api.count("/search/movie"), 1)
+        self.assertEqual(api.count("/movie/7"), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r == results[0] and r["year"] == "1999" for r in results))
+
+
+class TestMissCache(MetadataTestCase):
+    """Tests für das Cachen von Fehlschlägen"""
+
+    def test_miss_is_cached_within_ttl(self):
+        """Ein leeres Suchergebnis wird bis zum Ablauf der TTL aus dem Cache bedient"""
+        api = self.use_api(FakeApi({"/search/movie": FakeResponse(200, {"results": []})}))
+
+        self.assertIsNone(self.fetcher.fetch_movie("Unbekannt"))
+        self.assertIsNone(self.fetcher.fetch_movie("Unbekannt"))
+        self.assertEqual(api.count("/search/movie"), 1)
+
+        # Miss-Eintrag künstlich ablaufen lassen
+        past = (datetime.now() - timedelta(minutes=1)).isoformat()
+        with self.fetcher.cache._lock:
+            self.fetcher.cache._connect().execute("UPDATE metadata_cache SET expires_at = ?", (past,))
+
+        self.assertIsNone(self.fetcher.fetch_movie("Unbekannt"))
+        self.assertEqual(api.count("/search/movie"), 2)
+
+    def test_failed_request_writes_no_miss(self):
+        """HTTP-Fehler, Rate-Limits und Netzwerkfehler werden nicht als Miss gecacht"""
+        def offline():
+            raise OSError("Verbindung abgelehnt")
+
+        for answer in (FakeResponse(500), FakeResponse(401), FakeResponse(429), offline):
+            with self.subTest(answer=answer):
+                api = self.use_api(FakeApi({"/search/movie": answer}))
+                with self.assertLogs("MediaBrain.metadata", level="WARNING"):
+                    self.assertIsNone(self.fetcher.fetch_movie("Matrix"))
+                self.assertIsNone(self.fetcher.cache.get("movie", "Matrix", "movie"))
+
+                # Nächster Aufruf fragt erneut an
+                with self.assertLogs("MediaBrain.metadata", level="WARNING"):
+                    self.fetcher.fetch_movie("Matrix")
+                self.assertEqual(api.count("/search/movie"), 2)
+
+    def test_failed_music_request_writes_no_miss(self):
+        """Auch MusicBrainz-Fehler erzeugen keinen Miss-Eintrag"""
+        self.use_api(FakeApi({"/release": FakeResponse(503)}))
+        with self.assertLogs("MediaBrain.metadata", level="WARNING"):
+            self.assertIsNone(self.fetcher.fetch_music("Album", "Artist"))
+        self.assertIsNone(self.fetcher.cache.get("music", "Album", "music", artist="Artist"))
+
+
+class TestCoverArt(MetadataTestCase):
+    """Tests für die Cover-Art-Nachladung im Hintergrund"""
+
+    RELEASE = {"id": "r1", "title": "Album", "artist-credit": [{"name": "Artist"}], "date": "2001-05-01"}
+    COVER = "https://coverartarchive.org/r1/front.jpg"
+
+    def setUp(self):
+        super().setUp()
+        self.cover_released = threading.Event()
+
+        def cover():
+            # Cover erst freigeben, wenn der Test es erlaubt
+            self.cover_released.wait(5)
+            return FakeResponse(200, {"images": [{"image": self.COVER}]})
+
+        self.api = self.use_api(FakeApi({
+            "/ws/2/release": FakeResponse(200, {"releases": [self.RELEASE]}),
+            "coverartarchive.org/release/r1": cover,
+        }))
+
+    def tearDown(self):
+        self.cover_released.set()
+        super().tearDown()
+
+    def test_background_fill_updates_cache(self):
+        """Der erste Aufruf liefert kein Cover, der Cache-Eintrag wird im Hintergrund ergänzt"""
+        result = self.fetcher.fetch_music("Album", "Artist")
+        self.assertEqual(result["title"], "Album")
+        self.assertIsNone(result["thumbnail_url"])
+
+        self.cover_released.set()
+        key = MetadataCache._make_key("music", "Album", "music", artist="Artist")
+        future = self.fetcher._cover_fills.get(key)
+        if future is not None:
+            future.result(timeout=5)
+
+        cached = self.fetcher.cache.get("music", "Album", "music", artist="Artist")
+        self.assertEqual(cached["thumbnail_url"], self.COVER)
+        self.assertEqual(self.fetcher.fetch_music("Album", "Artist")["thumbnail_url"], self.COVER)
+        self.assertEqual(self.api.count("/ws/2/release"), 1)
+
+    def test_wait_for_cover_returns_cover(self):
+        """Mit wait_for_cover=True enthält bereits der erste Aufruf das Cover"""
+        threading.Timer(0.1, self.cover_released.set).start()
+        result = self.fetcher.fetch_music("Album", "Artist", wait_for_cover=True)
+        self.assertEqual(result["thumbnail_url"], self.COVER)
+
+
+if __name__ == "__main__":
+    unittest.main()
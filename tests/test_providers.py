@@ -10,6 +10,7 @@ Testet:
 """
 
 import sys
+import tempfile
 from pathlib import Path
 
 # Projekt-Root zum Path hinzufügen
@@ -234,6 +235,18 @@ class TestLocalProvider(unittest.TestCase):
         for ext, expected_type in types.items():
             self.assertEqual(self.provider.SUPPORTED[ext], expected_type)
 
+    def test_matches_only_supported_files(self):
+        """Nur existierende Dateien mit unterstützter Endung werden erkannt"""
+        with tempfile.TemporaryDirectory() as tmp:
+            video = Path(tmp) / "Film.MKV"
+            text = Path(tmp) / "notizen.txt"
+            video.touch()
+            text.touch()
+            self.assertTrue(self.provider.matches(str(video)))
+            self.assertFalse(self.provider.matches(str(text)))
+            self.assertFalse(self.provider.matches(str(Path(tmp) / "fehlt.mp4")))
+            self.assertFalse(self.provider.matches(tmp))
+
 
 class TestProviderRegistry(unittest.TestCase):
     """Tests für ProviderRegistry"""
@@ -256,6 +269,78 @@ class TestProviderRegistry(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result["source"], "spotify")
 
+    def test_identify_amazon_watch_url(self):
+        """amazon.{tld}-URL wird über die kombinierte URL-Regex identifiziert"""
+        result = ProviderRegistry.identify("https://www.amazon.de/gp/video/detail/B08WTXR123")
+        self.assertIsNotNone(result)
+        self.assertEqual(result["source"], "prime")
+        self.assertEqual(result["provider_id"], "B08WTXR123")
+
+    def test_identify_dispatches_to_url_provider(self):
+        """Die kombinierte URL-Regex liefert dasselbe Ergebnis wie der einzelne Provider"""
+        urls = {
+            "netflix": "https://www.netflix.com/watch/80057281",
+            "youtube": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "spotify": "https://open.spotify.com/album/4uLU6hMCjMI75M1A2tKUQC",
+            "disney": "https://www.disneyplus.com/video/the-mandalorian-s01e01",
+            "prime": "https://www.primevideo.com/detail/B08WTXR123",
+            "appletv": "https://tv.apple.com/us/movie/test/umc12345",
+            "twitch": "https://www.twitch.tv/ninja",
+        }
+        for source, url in urls.items():
+            with self.subTest(source=source):
+                provider = ProviderRegistry.get_provider_by_source(source)
+                self.assertEqual(ProviderRegistry.identify(url), provider.extract_info(url))
+
+    def test_identify_window_title(self):
+        """Fenstertitel wird über Schlüsselwörter identifiziert"""
+        result = ProviderRegistry.identify("Stranger Things - Netflix")
+        self.assertIsNotNone(result)
+        self.assertEqual(result["source"], "netflix")
+        self.assertEqual(result["title"], "Stranger Things")
+
+    def test_identify_keyword_exclude(self):
+        """Ausschluss-Phrasen verhindern den Keyword-Treffer"""
+        self.assertIsNone(ProviderRegistry.identify("Netflix Party - Google Chrome"))
+
+    def test_identify_ignores_mediabrain_window(self):
+        """Eigene MediaBrain-Fenster werden nicht erkannt"""
+        self.assertIsNone(ProviderRegistry.identify("MediaBrain - Netflix"))
+
+    def test_identify_returns_independent_copies(self):
+        """Gecachte Treffer werden als eigene Kopie geliefert"""
+        first = ProviderRegistry.identify("https://www.netflix.com/watch/80057281")
+        first["origin"] = "test"
+        second = ProviderRegistry.identify("https://www.netflix.com/watch/80057281")
+        self.assertNotIn("origin", second)
+        self.assertEqual(second["provider_id"], "80057281")
+
+    def test_clear_cache(self):
+        """clear_cache verwirft gecachte Treffer"""
+        ProviderRegistry.identify("https://www.twitch.tv/ninja")
+        ProviderRegistry.clear_cache()
+        self.assertEqual(ProviderRegistry._identify_known.cache_info().currsize, 0)
+
+    def test_identify_local_path_before_keywords(self):
+        """Dateipfade mit Provider-Namen werden als lokale Datei erkannt"""
+        with tempfile.TemporaryDirectory() as tmp:
+            video = Path(tmp) / "Netflix Mitschnitt.mp4"
+            video.touch()
+            result = ProviderRegistry.identify(str(video))
+        self.assertIsNotNone(result)
+        self.assertEqual(result["source"], "local")
+        self.assertEqual(result["type"], "movie")
+
+    def test_identify_many(self):
+        """Batch-Erkennung liefert ein Ergebnis pro Eingabe, auch bei Duplikaten"""
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        results = ProviderRegistry.identify_many([url, "Random Window", url])
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["source"], "youtube")
+        self.assertIsNone(results[1])
+        self.assertEqual(results[0], results[2])
+        self.assertIsNot(results[0], results[2])
+
     def test_get_provider_names(self):
         """Alle Provider-Namen werden zurückgegeben"""
         names = ProviderRegistry.get_provider_names()
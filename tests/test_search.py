@@ -0,0 +1,295 @@
+"""
+test_search.py
+Tests für die Suchlogik in search_advanced
+
+Testet:
+- Ergebnis-Cache und Invalidierung bei Schreibzugriffen
+- Keyset-Pagination (NULL-Werte, ASC/DESC, id-Tiebreaker)
+- FTS-Query-Aufbau und LIKE-Fallback
+- Präfix-Bereiche für Autocomplete
+- Suchprofile (atomares Speichern, Änderungserkennung, korrupte Dateien)
+
+search_advanced importiert PyQt6; ohne PyQt6 werden die Tests übersprungen.
+"""
+
+import sys
+from pathlib import Path
+
+# Projekt-Root zum Path hinzufügen
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from core import Database
+
+try:
+    import search_advanced
+    HAS_SEARCH = True
+except ImportError:
+    HAS_SEARCH = False
+
+
+@unittest.skipUnless(HAS_SEARCH, "PyQt6 nicht installiert")
+class TestSearchCache(unittest.TestCase):
+    """Tests für den LRU-Cache der SearchEngine"""
+
+    def setUp(self):
+        self.db = Database(":memory:")
+        self.db.execute(
+            "INSERT INTO media_items (title, type, source, provider_id, last_opened_at) VALUES (?, ?, ?, ?, ?)",
+            ("Erster", "movie", "netflix", "1", "2024-01-01")
+        )
+        self.engine = search_advanced.SearchEngine(self.db)
+
+    def tearDown(self):
+        self.db.conn.close()
+
+    def _titles(self, criteria):
+        return [item.title for item in self.engine.search(criteria)]
+
+    def test_repeated_search_is_cached(self):
+        """Gleiche Kriterien fragen die Datenbank nur einmal ab"""
+        with mock.patch.object(self.db, "fetchall", wraps=self.db.fetchall) as fetchall:
+            first = self._titles(search_advanced.SearchCriteria())
+            second = self._titles(search_advanced.SearchCriteria())
+        self.assertEqual(first, second)
+        self.assertEqual(fetchall.call_count, 1)
+
+    def test_writes_invalidate_cache(self):
+        """execute() und transaction() verwerfen gecachte Ergebnisse"""
+        criteria = search_advanced.SearchCriteria(sort_field="title", sort_desc=False)
+        self.assertEqual(self._titles(criteria), ["Erster"])
+
+        self.db.execute(
+            "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+            ("Zweiter", "movie", "netflix", "2")
+        )
+        self.assertEqual(self._titles(criteria), ["Erster", "Zweiter"])
+
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+                ("Dritter", "movie", "netflix", "3")
+            )
+        self.assertEqual(self._titles(criteria), ["Dritter", "Erster", "Zweiter"])
+
+    def test_time_filter_bypasses_cache(self):
+        """Relative Zeitfilter werden bei jeder Suche neu abgefragt"""
+        criteria = search_advanced.SearchCriteria(time_filter_days=7)
+        with mock.patch.object(self.db, "fetchall", wraps=self.db.fetchall) as fetchall:
+            self.engine.search(criteria)
+            self.engine.search(criteria)
+        self.assertEqual(fetchall.call_count, 2)
+        self.assertEqual(len(self.engine._cache), 0)
+
+
+@unittest.skipUnless(HAS_SEARCH, "PyQt6 nicht installiert")
+class TestKeysetPagination(unittest.TestCase):
+    """Seitenweise Suche liefert dieselbe Reihenfolge wie die ungeteilte Suche"""
+
+    def setUp(self):
+        self.db = Database(":memory:")
+        # Doppelte Sortwerte (Tiebreaker), NULL-Werte in last_opened_at
+        titles = ["Beta", "alpha", "Gamma", "beta", "Alpha", "delta", "Gamma", "epsilon"]
+        opened = ["2024-01-03", None, "2024-01-01", "2024-01-03", None, "2024-01-02", "2024-01-01", None]
+        created = ["2023-05-01", "2023-05-02", "2023-05-01", "2023-05-03", "2023-05-02", "2023-05-01", "2023-05-04", "2023-05-03"]
+        rows = [
+            (title, "movie", "netflix", f"p{i}", opened[i], created[i])
+            for i, title in enumerate(titles)
+        ]
+        self.db.conn.executemany(
+            "INSERT INTO media_items (title, type, source, provider_id, last_opened_at, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        self.engine = search_advanced.SearchEngine(self.db)
+
+    def tearDown(self):
+        self.db.conn.close()
+
+    def test_pages_match_unpaged_order(self):
+        """Für jedes Sortierfeld und beide Richtungen stimmen die Seiten mit der Gesamtliste überein"""
+        for sort_field in sorted(search_advanced._SORT_FIELDS):
+            for desc in (True, False):
+                with self.subTest(sort_field=sort_field, desc=desc):
+                    criteria = search_advanced.SearchCriteria(sort_field=sort_field, sort_desc=desc)
+                    expected = [item.id for item in self.engine.search(criteria)]
+                    self.assertEqual(len(expected), 8)
+
+                    paged = []
+                    page = search_advanced.SearchCriteria(sort_field=sort_field, sort_desc=desc, page_size=3)
+                    while True:
+                        items = self.engine.search(page)
+                        paged.extend(item.id for item in items)
+                        if len(items) < page.page_size:
+                            break
+                        page = page.next_page(items[-1])
+
+                    self.assertEqual(paged, expected)
+
+    def test_unknown_sort_field_falls_back(self):
+        """Sortierung nach einer nicht vorhandenen Spalte nutzt last_opened_at"""
+        criteria = search_advanced.SearchCriteria(sort_field="rating", page_size=3)
+        items = self.engine.search(criteria)
+        self.assertEqual(len(items), 3)
+        self.assertIsNotNone(criteria.next_page(items[-1]).cursor_id)
+
+
+@unittest.skipUnless(HAS_SEARCH, "PyQt6 nicht installiert")
+class TestFtsQuery(unittest.TestCase):
+    """Tests für build_fts_query und die Textsuche"""
+
+    def test_tokens_are_quoted_prefixes(self):
+        """Jedes Wort wird gequotet und als Präfix gesucht"""
+        self.assertEqual(search_advanced.build_fts_query("Caf soc"), '"Caf"* "soc"*')
+
+    def test_quotes_and_operators_are_escaped(self):
+        """Anführungszeichen werden verdoppelt, FTS-Operatoren bleiben Text"""
+        self.assertEqual(search_advanced.build_fts_query('say "hi"'), '"say"* """hi"""*')
+        self.assertEqual(search_advanced.build_fts_query("NEAR( AND"), '"NEAR("* "AND"*')
+
+    def test_no_fts_query(self):
+        """CJK, leere Eingabe und reine Satzzeichen gehen nicht über FTS"""
+        for text in ("進撃の巨人", "", "   ", "!!!", "- ... ?"):
+            with self.subTest(text=text):
+                self.assertIsNone(search_advanced.build_fts_query(text))
+
+    def test_punctuation_tokens_are_skipped(self):
+        """Satzzeichen zwischen Wörtern werden übergangen"""
+        self.assertEqual(search_advanced.build_fts_query("Spider - Man"), '"Spider"* "Man"*')
+
+    def test_search_falls_back_to_like(self):
+        """Ohne FTS-Query sucht die Engine per LIKE statt nichts zu finden"""
+        db = Database(":memory:")
+        db.conn.executemany(
+            "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, ?, ?, ?)",
+            [("Café Society", "movie", "netflix", "1"), ("Wow!!!", "clip", "youtube", "2"),
+             ("進撃の巨人", "series", "netflix", "3")]
+        )
+        engine = search_advanced.SearchEngine(db)
+        self.assertTrue(db.has_fts)
+
+        def titles(text):
+            return [item.title for item in engine.search(search_advanced.SearchCriteria(text=text))]
+
+        self.assertEqual(titles("cafe"), ["Café Society"])
+        self.assertEqual(titles("!!!"), ["Wow!!!"])
+        self.assertEqual(titles("巨人"), ["進撃の巨人"])
+        db.conn.close()
+
+
+@unittest.skipUnless(HAS_SEARCH, "PyQt6 nicht installiert")
+class TestPrefixRange(unittest.TestCase):
+    """Tests für prefix_range und get_suggestions"""
+
+    def test_upper_bound_edge_cases(self):
+        """Obergrenzen für leeres Präfix, höchsten Codepoint, A-Z-Sprung und Surrogate"""
+        prefix_range = search_advanced.prefix_range
+        self.assertEqual(prefix_range(""), ("", None))
+        self.assertEqual(prefix_range("\U0010ffff"), ("\U0010ffff", None))
+        self.assertEqual(prefix_range("a\U0010ffff"), ("a\U0010ffff", "b"))
+        self.assertEqual(prefix_range("x@"), ("x@", "x["))
+        self.assertEqual(prefix_range("a\ud7ff"), ("a\ud7ff", "a\ue000"))
+
+    def test_case_folding(self):
+        """Nur ASCII wird gefaltet, wie bei COLLATE NOCASE"""
+        prefix_range = search_advanced.prefix_range
+        self.assertEqual(prefix_range("StAr"), ("star", "stas"))
+        self.assertEqual(prefix_range("Äp"), ("Äp", "Äq"))
+
+    def test_range_matches_like(self):
+        """Der Bereich findet dieselben Titel wie LIKE 'präfix%'"""
+        titles = [
+            "Star Wars", "star trek", "Stargate", "Start", "Stas", "st", "X@b", "x[y", "xA",
+            "Xz", "Äpfel", "äpfel", "a\U0010ffffz", "b", "ab", "", "_x", "%y",
+        ]
+        db = Database(":memory:")
+        db.conn.executemany(
+            "INSERT INTO media_items (title, type, source, provider_id) VALUES (?, 'clip', 'local', ?)",
+            [(title, str(i)) for i, title in enumerate(titles)]
+        )
+        engine = search_advanced.SearchEngine(db)
+        for prefix in ("st", "STAR", "star ", "x@", "xa", "Äp", "a\U0010ffff", "ab"):
+            with self.subTest(prefix=prefix):
+                like = db.fetchall("SELECT title FROM media_items WHERE title LIKE ?", (prefix + "%",))
+                self.assertEqual(
+                    sorted(engine.get_suggestions(prefix, limit=100)),
+                    sorted({row["title"] for row in like})
+                )
+        db.conn.close()
+
+
+@unittest.skipUnless(HAS_SEARCH, "PyQt6 nicht installiert")
+class TestSearchProfileManager(unittest.TestCase):
+    """Tests für SearchProfileManager"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.path = self.dir / "search_profiles.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _criteria(self, text):
+        return search_advanced.SearchCriteria(text=text, tags=["a"])
+
+    def test_save_is_atomic(self):
+        """Gespeichert wird über eine Temp-Datei und os.replace"""
+        manager = search_advanced.SearchProfileManager(self.path)
+        with mock.patch("search_advanced.os.replace", wraps=os.replace) as replace:
+            manager.save_profile("filme", self._criteria("x"))
+        replace.assert_called_once_with(self.path.with_suffix(".json.tmp"), self.path)
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()), ["search_profiles.json"])
+
+        reloaded = search_advanced.SearchProfileManager(self.path)
+        self.assertEqual(reloaded.load_profile("filme"), self._criteria("x"))
+
+    def test_failed_replace_keeps_old_file(self):
+        """Scheitert das Ersetzen, bleibt die bisherige Datei unverändert"""
+        manager = search_advanced.SearchProfileManager(self.path)
+        manager.save_profile("alt", self._criteria("alt"))
+        before = self.path.read_bytes()
+        with mock.patch("search_advanced.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                manager.save_profile("neu", self._criteria("neu"))
+        self.assertEqual(self.path.read_bytes(), before)
+
+    def test_unchanged_profiles_are_not_rewritten(self):
+        """Identische Daten (gleicher blake2b-Hash) werden nicht erneut geschrieben"""
+        manager = search_advanced.SearchProfileManager(self.path)
+        manager.save_profile("filme", self._criteria("x"))
+        with mock.patch("search_advanced.os.replace", wraps=os.replace) as replace:
+            manager.save_profile("filme", self._criteria("x"))
+            search_advanced.SearchProfileManager(self.path).save_profile("filme", self._criteria("x"))
+            self.assertEqual(replace.call_count, 0)
+            manager.save_profile("filme", self._criteria("y"))
+            self.assertEqual(replace.call_count, 1)
+
+        # Extern gelöschte Datei wird auch bei gleichem Inhalt neu geschrieben
+        self.path.unlink()
+        manager.save_profile("filme", self._criteria("y"))
+        self.assertTrue(self.path.exists())
+
+    def test_corrupt_file_is_moved_aside(self):
+        """Korrupte Dateien werden einzeln gesichert, ohne ältere Sicherungen zu überschreiben"""
+        for content in (b"{kaputt", b"[1, 2]"):
+            self.path.write_bytes(content)
+            with self.assertLogs("MediaBrain.search", level="WARNING"):
+                manager = search_advanced.SearchProfileManager(self.path)
+            self.assertEqual(manager.profiles, {})
+            self.assertFalse(self.path.exists())
+
+        backups = sorted(self.dir.glob("search_profiles.json.corrupt-*"))
+        self.assertEqual(len(backups), 2)
+        self.assertEqual(sorted(p.read_bytes() for p in backups), [b"[1, 2]", b"{kaputt"])
+
+        # Danach normaler Betrieb ohne Datei
+        manager.save_profile("filme", self._criteria("x"))
+        self.assertIn("filme", search_advanced.SearchProfileManager(self.path).profiles)
+
+
+if __name__ == "__main__":
+    unittest.main()
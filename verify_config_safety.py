@@ -1,6 +1,7 @@
 import sys
 import os
 import time
+from contextlib import suppress
 
 # Add current dir to path to import config
 sys.path.append(os.getcwd())
@@ -11,13 +12,11 @@ def test_safe_config():
     print("--- START Config Safety Test ---")
     
     # Clean state
-    if SETTINGS_PATH.exists():
-        try: os.remove(SETTINGS_PATH)
-        except: pass
     backup_path = SETTINGS_PATH.with_suffix(".json.bak")
-    if backup_path.exists():
-        try: os.remove(backup_path)
-        except: pass
+    with suppress(FileNotFoundError):
+        os.remove(SETTINGS_PATH)
+    with suppress(FileNotFoundError):
+        os.remove(backup_path)
 
     # 1. Init Config (creates defaults)
     conf = Config()
@@ -55,10 +54,10 @@ def test_safe_config():
         print(f"ERROR: Unexpected value '{val}'")
 
     # Cleanup
-    try:
-        if SETTINGS_PATH.exists(): os.remove(SETTINGS_PATH)
-        if backup_path.exists(): os.remove(backup_path)
-    except: pass
+    with suppress(FileNotFoundError):
+        os.remove(SETTINGS_PATH)
+    with suppress(FileNotFoundError):
+        os.remove(backup_path)
     
     print("--- END Config Safety Test ---")
 